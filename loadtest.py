@@ -0,0 +1,213 @@
+"""
+대시보드 동시 세션 부하 테스트 (Streamlit AppTest로 실제 코드 경로를 헤드리스 실행).
+
+세션마다 프로세스 하나에 AppTest 하나를 띄워 선수 선택, 세부사항, 월/이닝 선택을 무작위로
+바꿔 가며 rerun 지연을 잰다. AppTest는 프로세스 전역 Runtime 하나를 쓰고 매 실행마다
+스크립트를 컴파일하므로, 한 프로세스에서 여러 AppTest를 스레드로 돌리면 서로 간섭한다
+(KeyError, "Runtime hasn't been created!", ast.parse의 recursion depth mismatch).
+그래서 세션은 각자 독립 프로세스이고, 캐시(st.cache_data / st.cache_resource)도 세션마다
+따로다 — 서버 한 대의 세션 간 캐시 공유가 아니라 세션 수만큼의 독립 서버에 가깝다.
+
+rerun 지연에 잡히는 것은 뷰 캐시 미스(섹션 계산)까지다. 워크북 로드는 페이지 열기에서
+일어나므로 따로 open 지연으로 보고한다. --cold는 스냅샷을 우회해 세션마다 페이지 열기가
+xlsx(openpyxl) 전체 파싱을 포함하게 한다.
+
+실패한 조작(스크립트 예외, AppTest 예외)은 오류로만 세고 지연/처리량 집계에서는 뺀다.
+오류가 하나라도 있으면 종료 코드 1.
+
+    $ python loadtest.py --sessions 8 --steps 30
+    $ python loadtest.py --sessions 16 --steps 50 --cold --json bench.json
+"""
+import argparse
+import json
+import multiprocessing as mp
+import os
+import queue
+import random
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+import stat_store
+from stat_store import HITTER_PATHS, PITCHER_PATHS, load_or_build, player_names
+from views import DETAILS, MONTH_OPTIONS, INNING_OPTIONS
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "streamlit_app.py")
+
+class Session:
+    """AppTest 하나 = 대시보드 세션 하나. 성공한 rerun의 지연(초)과 오류 종류를 기록"""
+
+    def __init__(self, players, seed, timeout):
+        self.players = players
+        self.rng = random.Random(seed)
+        self.at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        self.latencies = []
+        self.open_latency = None
+        self.errors = Counter()
+
+    def fail(self, kind):
+        self.errors[kind[:120]] += 1
+
+    def run(self, widget=None):
+        """rerun 하나. 스크립트 예외가 나면 오류로 세고 지연은 버림(AppTest 예외는 호출자가 처리)"""
+        t0 = time.perf_counter()
+        (widget or self.at).run()
+        elapsed = time.perf_counter() - t0
+        if self.at.exception:
+            for e in self.at.exception:
+                self.fail(str(e.message).splitlines()[0] if e.message else "스크립트 예외")
+            return None
+        return elapsed
+
+    def step(self, action):
+        """조작 하나를 실행하고 성공한 rerun 지연만 기록 — 어떤 예외든 오류로 세고 계속 진행"""
+        try:
+            for elapsed in action():
+                if elapsed is None:
+                    return
+                self.latencies.append(elapsed)
+        except Exception as e:
+            self.fail(f"{type(e).__name__}: {e}")
+
+    def pick_player(self):
+        position = self.rng.choice(["타자", "투수"])
+        name = self.rng.choice(self.players[position])
+        yield self.run(self.at.sidebar.radio[0].set_value(position))
+        yield self.run(self.at.text_input[0].input(name))
+        if self.at.selectbox and name in self.at.selectbox[0].options:
+            yield self.run(self.at.selectbox[0].set_value(name))
+
+    def pick_detail(self):
+        yield self.run(self.at.sidebar.radio[1].set_value(self.rng.choice(DETAILS)))
+
+    def pick_sub(self):
+        detail = self.at.sidebar.radio[1].value
+        if detail not in ("월별", "이닝별"):
+            yield from self.pick_detail()
+            return
+        options = MONTH_OPTIONS if detail == "월별" else INNING_OPTIONS
+        yield self.run(self.at.sidebar.select_slider[0].set_value(self.rng.choice(options)))
+
+    def open(self):
+        """첫 실행(페이지 열기, rerun 집계와 별도)"""
+        try:
+            elapsed = self.run()
+        except Exception as e:
+            self.fail(f"{type(e).__name__}: {e}")
+            elapsed = None
+        self.open_latency = elapsed
+        return self
+
+    def play(self, steps):
+        self.step(self.pick_player)
+        for _ in range(steps):
+            action = self.rng.choices(
+                [self.pick_player, self.pick_detail, self.pick_sub], weights=[2, 3, 3]
+            )[0]
+            self.step(action)
+        return self
+
+def session_main(seed, players, steps, timeout, cold, start, results):
+    """세션 프로세스 본체: 페이지 열기 → 전 세션 동시 출발 → 조작 → 결과를 큐로"""
+    if cold:
+        stat_store.SNAPSHOT_PATH = ""  # 앱의 load_or_build가 스냅샷 없이 xlsx를 파싱
+    session = Session(players, seed, timeout).open()
+    try:
+        start.wait()
+    except threading.BrokenBarrierError:
+        session.fail("BrokenBarrierError: 동시 출발 대기 실패")
+    t0 = time.time()
+    session.play(steps)
+    results.put({
+        "latencies": session.latencies,
+        "open_latency": session.open_latency,
+        "errors": dict(session.errors),
+        "start": t0,
+        "end": time.time(),
+    })
+
+def run_sessions(n, players, steps, seed, timeout, cold):
+    """세션 n개를 각자 프로세스로 돌려 결과 dict 리스트와 비정상 종료 세션 수 반환"""
+    ctx = mp.get_context("spawn")  # 부모의 Streamlit 상태를 물려받지 않도록
+    start = ctx.Barrier(n, timeout=timeout * 3)
+    results = ctx.Queue()
+    procs = [
+        ctx.Process(target=session_main, args=(seed + i, players, steps, timeout, cold, start, results))
+        for i in range(n)
+    ]
+    for p in procs:
+        p.start()
+    out = []
+    while len(out) < n:
+        try:
+            out.append(results.get(timeout=1.0))
+        except queue.Empty:
+            if not any(p.is_alive() for p in procs):
+                break
+    while len(out) < n:  # 종료 직전에 넣은 결과가 남아 있을 수 있음
+        try:
+            out.append(results.get(timeout=1.0))
+        except queue.Empty:
+            break
+    for p in procs:
+        p.join()
+    return out, n - len(out)
+
+def summarize(results, lost):
+    lat = np.array([x for r in results for x in r["latencies"]]) * 1000.0
+    opens = np.array([r["open_latency"] for r in results if r["open_latency"] is not None]) * 1000.0
+    kinds = Counter()
+    for r in results:
+        kinds.update(r["errors"])
+    if lost:
+        kinds["세션 프로세스 비정상 종료"] += lost
+    wall = (max(r["end"] for r in results) - min(r["start"] for r in results)) if results else 0.0
+    return {
+        "sessions": len(results) + lost,
+        "reruns": int(lat.size),
+        "errors": sum(kinds.values()),
+        "error_kinds": dict(kinds.most_common()),
+        "wall_s": round(wall, 3),
+        "throughput_rps": round(lat.size / wall, 2) if wall > 0 else None,
+        "p50_ms": round(float(np.percentile(lat, 50)), 1) if lat.size else None,
+        "p95_ms": round(float(np.percentile(lat, 95)), 1) if lat.size else None,
+        "p99_ms": round(float(np.percentile(lat, 99)), 1) if lat.size else None,
+        "max_ms": round(float(lat.max()), 1) if lat.size else None,
+        "open_p50_ms": round(float(np.percentile(opens, 50)), 1) if opens.size else None,
+        "open_max_ms": round(float(opens.max()), 1) if opens.size else None,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대시보드 동시 세션 부하 테스트")
+    parser.add_argument("--sessions", type=int, default=8, help="동시 세션(프로세스) 수")
+    parser.add_argument("--steps", type=int, default=30, help="세션당 조작 횟수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=60.0, help="rerun 하나의 제한 시간(초)")
+    parser.add_argument("--cold", action="store_true", help="스냅샷을 우회해 세션마다 xlsx를 재파싱")
+    parser.add_argument("--json", help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args(argv)
+
+    snap = load_or_build(HITTER_PATHS, PITCHER_PATHS)
+    players = {"타자": player_names(snap, HITTER_PATHS)[0], "투수": player_names(snap, PITCHER_PATHS)[0]}
+
+    results, lost = run_sessions(args.sessions, players, args.steps, args.seed, args.timeout, args.cold)
+    result = summarize(results, lost)
+
+    print(
+        f"sessions={result['sessions']} reruns={result['reruns']} errors={result['errors']} "
+        f"wall={result['wall_s']}s throughput={result['throughput_rps']}/s"
+    )
+    print(f"latency ms: p50={result['p50_ms']} p95={result['p95_ms']} p99={result['p99_ms']} max={result['max_ms']}")
+    print(f"page open ms: p50={result['open_p50_ms']} max={result['open_max_ms']}")
+    for kind, count in result["error_kinds"].items():
+        print(f"  error x{count}: {kind}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    return 1 if result["errors"] else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,248 @@
+"""
+선수 리포트 정적 사전 렌더링 — 앱과 같은 뷰(views.py)를 HTML(선택: PNG)로 일괄 생성.
+
+데이터는 부모 프로세스에서 스냅샷을 한 번 준비해 워커 initializer로 넘기고, 워커는 그것만 올려 쓴다
+(워커마다 해시 검사나 xlsx 파싱을 다시 하지 않음). 선수 하나 = 작업 하나로 프로세스 풀에 분배.
+
+    $ python prerender.py                                  # 전 선수 → reports/
+    $ python prerender.py --position 타자 --players 구자욱 김성윤
+    $ python prerender.py --roster roster.txt --workers 8 --png
+
+PNG 저장에는 vl-convert-python이 필요하다(`pip install vl-convert-python`).
+"""
+import argparse
+import html
+import importlib.util
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import altair as alt
+
+from stat_store import (
+    HITTER_PATHS, PITCHER_PATHS, load_or_build, install_snapshot, player_names, split_check,
+    quarantine_enabled, served_paths, held_paths,
+)
+from views import (
+    DETAILS, compute_view, view_options,
+    horizontal_row_from_df, section_bar_chart, section_trend_chart, trend_table,
+)
+
+OUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reports")
+
+DETAIL_SLUGS = {
+    "주자 득점권": "risp",
+    "세부사항 없음": "overall",
+    "주자 있음": "runners_on",
+    "주자 없음": "runners_off",
+    "이닝별": "innings",
+    "월별": "months",
+}
+
+# ============== 차트 spec ==============
+# altair 차트 생성/검증이 페이지 렌더 시간의 대부분이라, 모양이 같은 차트는
+# 데이터 없는 템플릿 spec을 한 번만 만들고 데이터(datasets)만 갈아 끼운다.
+SPEC_TEMPLATES = {}
+
+def chart_spec(sec):
+    """bar/trend 섹션의 vega-lite spec(dict)"""
+    if sec["kind"] == "bar":
+        key = ("bar", sec["fmt"], sec.get("height", 340), tuple(sec.get("domain") or ()))
+        build = section_bar_chart
+    else:
+        key = ("trend", sec["y"], tuple(sec["order"]))
+        build = section_trend_chart
+    if key not in SPEC_TEMPLATES:
+        spec = build({**sec, "df": sec["df"].iloc[:0]}).properties(width="container").to_dict()
+        spec.pop("datasets", None)
+        spec["data"] = {"name": "table"}
+        SPEC_TEMPLATES[key] = json.dumps(spec, ensure_ascii=False)
+    spec = json.loads(SPEC_TEMPLATES[key])
+    spec["datasets"] = {"table": json.loads(sec["df"].to_json(orient="records", force_ascii=False))}
+    return spec
+
+PAGE_HEAD = f"""<!doctype html>
+<html lang="ko"><head><meta charset="utf-8"><title>@@TITLE@@</title>
+<script src="https://cdn.jsdelivr.net/npm/vega@{alt.VEGA_VERSION}"></script>
+<script src="https://cdn.jsdelivr.net/npm/vega-lite@{alt.VEGALITE_VERSION}"></script>
+<script src="https://cdn.jsdelivr.net/npm/vega-embed@{alt.VEGAEMBED_VERSION}"></script>
+<style>
+body {{ font-family: sans-serif; margin: 2rem; }}
+.metrics, .columns {{ display: flex; gap: 2rem; }}
+.columns > div {{ flex: 1; }}
+.metric .label {{ font-size: .85rem; color: #555; }}
+.metric .value {{ font-size: 1.8rem; }}
+.chart {{ width: 100%; }}
+.caption {{ font-size: .85rem; color: #777; }}
+.info {{ background: #e8f0fe; padding: .5rem 1rem; }}
+.error {{ background: #fde8e8; padding: .5rem 1rem; }}
+.warning {{ background: #fff4e0; padding: .5rem 1rem; }}
+table {{ border-collapse: collapse; }}
+td, th {{ border: 1px solid #ddd; padding: .2rem .6rem; text-align: right; }}
+</style></head><body>
+"""
+
+def page_head(title):
+    return PAGE_HEAD.replace("@@TITLE@@", html.escape(title))
+
+# ============== 섹션 → HTML ==============
+class Page:
+    """HTML 조각과 차트(vega-lite spec)를 모아 한 페이지로 출력"""
+
+    def __init__(self, title):
+        self.title = title
+        self.parts = [f"<h2>{html.escape(title)}</h2>"]
+        self.charts = []
+
+    def chart(self, sec):
+        div_id = f"chart{len(self.charts)}"
+        self.charts.append((div_id, chart_spec(sec)))
+        self.parts.append(f'<div class="chart" id="{div_id}"></div>')
+
+    def table(self, df, caption):
+        self.parts.append(f'<p class="caption">{html.escape(caption)}</p>')
+        self.parts.append(df.to_html(index=False, border=0))
+
+    def section(self, sec):
+        kind = sec["kind"]
+        if kind in ("error", "info", "warning"):
+            self.parts.append(f'<p class="{kind}">{html.escape(sec["text"])}</p>')
+        elif kind == "heading":
+            self.parts.append(f"<h4>{html.escape(sec['text'].lstrip('# '))}</h4>")
+        elif kind == "metrics":
+            self.parts.append('<div class="metrics">' + "".join(
+                f'<div class="metric"><div class="label">{html.escape(label)}</div>'
+                f'<div class="value">{html.escape(value)}</div></div>'
+                for label, value in sec["items"]
+            ) + "</div>")
+        elif kind == "columns":
+            self.parts.append('<div class="columns">')
+            for sub in sec["sections"]:
+                self.parts.append("<div>")
+                self.section(sub)
+                self.parts.append("</div>")
+            self.parts.append("</div>")
+        elif kind == "bar":
+            if sec.get("title"):
+                self.parts.append(f"<h4>{html.escape(sec['title'])}</h4>")
+            self.chart(sec)
+            self.table(horizontal_row_from_df(sec["df"], is_rate=sec["is_rate"]), sec["caption"])
+        elif kind == "trend":
+            self.parts.append(f"<h4>{html.escape(sec['title'])}</h4>")
+            self.chart(sec)
+            if sec.get("caption"):
+                self.table(trend_table(sec), sec["caption"])
+
+    def html(self):
+        embeds = "".join(
+            f"vegaEmbed('#{div_id}', {json.dumps(spec, ensure_ascii=False)}, {{actions: false}});\n"
+            for div_id, spec in self.charts
+        )
+        return (page_head(self.title) + "\n".join(self.parts)
+                + f"\n<script>\n{embeds}</script>\n</body></html>\n")
+
+# ============== 워커 ==============
+PNG_WIDTH = 640  # PNG는 컨테이너 폭이 없으므로 고정 폭
+POSITION_PATHS = {"타자": HITTER_PATHS, "투수": PITCHER_PATHS}
+QUARANTINED = {}  # 포지션 → {경로: 격리 선수들}
+
+def init_worker(snap, quarantined):
+    """부모가 올린 스냅샷을 그대로 등록 — 이후 read_xlsx는 파싱 없이 스냅샷 시트를 씀"""
+    install_snapshot(snap, HITTER_PATHS + PITCHER_PATHS)
+    QUARANTINED.update(quarantined)
+
+def player_slug(name, used):
+    """워크북에서 온 선수명을 디렉터리명으로 (한글/영숫자/-/_만 남김, used 안에서 겹치면 번호를 붙임)"""
+    base = re.sub(r"[^\w\-]+", "_", name).strip("._") or "player"
+    slug, n = base, 1
+    while slug in used:
+        n += 1
+        slug = f"{base}_{n}"
+    used.add(slug)
+    return slug
+
+def render_player(position, player_name, slug, out_dir, png):
+    """선수 한 명의 세부사항 6개 뷰를 out_dir/포지션/slug/에 저장하고 [(세부사항, 상대경로)] 반환"""
+    quarantined = QUARANTINED.get(position, {})
+    paths = served_paths(POSITION_PATHS[position], quarantined, player_name)
+    held = held_paths(POSITION_PATHS[position], quarantined, player_name)
+    player_dir = os.path.join(out_dir, position, slug)
+    os.makedirs(player_dir, exist_ok=True)
+    written = []
+    for detail in DETAILS:
+        page = Page(f"{player_name} — {detail}")
+        for sub in view_options(detail):
+            if sub is not None:
+                page.parts.append(f"<h3>{html.escape(sub)}</h3>")
+            for sec in compute_view(position, paths, player_name, detail, sub, held):
+                page.section(sec)
+        page_slug = DETAIL_SLUGS[detail]
+        with open(os.path.join(player_dir, f"{page_slug}.html"), "w", encoding="utf-8") as f:
+            f.write(page.html())
+        if png:
+            import vl_convert as vlc
+            for i, (_, spec) in enumerate(page.charts):
+                with open(os.path.join(player_dir, f"{page_slug}_{i}.png"), "wb") as f:
+                    f.write(vlc.vegalite_to_png({**spec, "width": PNG_WIDTH}, scale=2))
+        written.append((detail, f"{position}/{slug}/{page_slug}.html"))
+    return position, player_name, written
+
+def write_index(out_dir, results):
+    rows = []
+    for position, player_name, written in sorted(results):
+        links = " · ".join(f'<a href="{html.escape(href)}">{html.escape(detail)}</a>' for detail, href in written)
+        rows.append(f"<tr><td>{html.escape(position)}</td><td>{html.escape(player_name)}</td><td>{links}</td></tr>")
+    with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(page_head("2025 선수 리포트") + "<h2>2025 선수 리포트</h2><table>"
+                + "\n".join(rows) + "</table></body></html>\n")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="선수 리포트 정적 사전 렌더링")
+    parser.add_argument("--position", choices=["타자", "투수"], help="한 포지션만 (기본: 둘 다)")
+    parser.add_argument("--players", nargs="*", help="선수명 목록 (기본: 리그 전체)")
+    parser.add_argument("--roster", help="선수명 한 줄에 하나씩 적힌 파일")
+    parser.add_argument("--out", default=OUT_DIR, help="출력 디렉터리")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="프로세스 수")
+    parser.add_argument("--png", action="store_true", help="차트를 PNG로도 저장 (vl-convert-python 필요)")
+    parser.add_argument("--no-quarantine", action="store_true",
+                        help="정합성 불일치 행도 그대로 사용 (환경변수 QUARANTINE_BAD_SPLITS=0과 같음)")
+    args = parser.parse_args(argv)
+
+    if args.png and importlib.util.find_spec("vl_convert") is None:
+        parser.error("--png에는 vl-convert-python이 필요합니다: pip install vl-convert-python")
+
+    t0 = time.perf_counter()
+    snap = load_or_build(HITTER_PATHS, PITCHER_PATHS)
+    quarantined = {}
+    if quarantine_enabled() and not args.no_quarantine:
+        quarantined = {position: split_check(snap, position, paths)[1] for position, paths in POSITION_PATHS.items()}
+
+    wanted = set(args.players or [])
+    if args.roster:
+        with open(args.roster, encoding="utf-8") as f:
+            wanted.update(line.strip() for line in f if line.strip())
+    jobs = []
+    for position in ([args.position] if args.position else ["타자", "투수"]):
+        names, _ = player_names(snap, POSITION_PATHS[position])
+        used = set()
+        jobs += [(position, n, player_slug(n, used)) for n in names if not wanted or n in wanted]
+    missing = wanted - {n for _, n, _ in jobs}
+    if missing:
+        print(f"명단에서 찾지 못한 선수: {', '.join(sorted(missing))}")
+
+    os.makedirs(args.out, exist_ok=True)
+    results = []
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker, initargs=(snap, quarantined)) as pool:
+        futures = [pool.submit(render_player, position, name, slug, args.out, args.png)
+                   for position, name, slug in jobs]
+        for fut in as_completed(futures):
+            results.append(fut.result())
+    write_index(args.out, results)
+
+    pages = sum(len(w) for _, _, w in results)
+    print(f"{args.out}: 선수 {len(results)}명, 페이지 {pages}개 ({time.perf_counter() - t0:.1f}s)")
+
+if __name__ == "__main__":
+    main()
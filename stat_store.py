@@ -0,0 +1,547 @@
+"""
+2025 시즌 스탯 스토어: 파일 경로 해석, xlsx 파싱 유틸, 분할 정합성 검증, 스냅샷.
+
+Streamlit 없이도 import 가능 — 스냅샷 빌드:
+    $ python stat_store.py            # data/stat_store.snapshot 생성
+    $ python stat_store.py --out PATH
+"""
+import argparse
+import hashlib
+import os
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+
+# ============== 파일 경로 ==============
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+SEARCH_DIRS = [APP_DIR, os.path.join(APP_DIR, "data")]
+
+HITTER_FILES = [
+    "2025_타자_1~3회.xlsx",
+    "2025_타자_3~4월.xlsx",
+    "2025_타자_4~6회.xlsx",
+    "2025_타자_5월.xlsx",
+    "2025_타자_6월.xlsx",
+    "2025_타자_7월.xlsx",
+    "2025_타자_7회이후.xlsx",
+    "2025_타자_8월.xlsx",
+    "2025_타자_9월이후.xlsx",
+    "2025_타자_주자득점권.xlsx",
+    "2025_타자_주자없음.xlsx",
+    "2025_타자_주자있음.xlsx",
+    "2025_타자_최종성적1.xlsx",
+    "2025_타자_최종성적2.xlsx",
+]
+
+PITCHER_FILES = [
+    "2025_투수_1~3회.xlsx",
+    "2025_투수_3~4월.xlsx",
+    "2025_투수_4~6회.xlsx",
+    "2025_투수_5월.xlsx",
+    "2025_투수_6월.xlsx",
+    "2025_투수_7월.xlsx",
+    "2025_투수_7회이후.xlsx",
+    "2025_투수_8월.xlsx",
+    "2025_투수_9월이후.xlsx",
+    "2025_투수_주자득점권.xlsx",
+    "2025_투수_주자없음.xlsx",
+    "2025_투수_주자있음.xlsx",
+    "2025_투수_최종성적1.xlsx",
+    "2025_투수_최종성적2.xlsx",
+    "2025_투수_최종성적3.xlsx",
+    "2025_투수_최종성적4.xlsx",
+]
+
+def resolve_existing_paths(filenames):
+    found = []
+    for name in filenames:
+        for d in SEARCH_DIRS:
+            p = os.path.join(d, name)
+            if os.path.exists(p):
+                found.append(p)
+                break
+    return list(dict.fromkeys(found))
+
+HITTER_PATHS = resolve_existing_paths(HITTER_FILES)
+PITCHER_PATHS = resolve_existing_paths(PITCHER_FILES)
+
+# ============== 유틸 ==============
+SHEETS = {}  # 스냅샷에서 올린 시트 (경로 → DataFrame), install_snapshot이 채움
+
+def read_xlsx(path):
+    """스냅샷에 올라온 시트가 있으면 복사본을, 없으면 xlsx를 직접 파싱"""
+    df = SHEETS.get(path)
+    if df is not None:
+        return df.copy()
+    return pd.read_excel(path, engine="openpyxl")
+
+def find_path(paths, suffix):
+    """경로 목록에서 파일명(suffix)으로 끝나는 첫 경로 반환"""
+    return next((p for p in paths if suffix and p.endswith(suffix)), None)
+
+def files_signature(paths):
+    """(경로, 수정시각, 크기) 튜플 — 워크북이 바뀌면 캐시 키도 바뀜"""
+    sig = []
+    for p in paths:
+        try:
+            s = os.stat(p)
+            sig.append((p, s.st_mtime_ns, s.st_size))
+        except OSError:
+            sig.append((p, None, None))
+    return tuple(sig)
+
+def first_col_strip(df):
+    """첫 번째 열(선수명)만 공백 strip 후 반환"""
+    return df.iloc[:, 0].dropna().astype(str).map(lambda x: x.strip())
+
+def normalize_colname(s: str) -> str:
+    """컬럼명 비교용 정규화(소문자, 양쪽 공백 제거)"""
+    return str(s).strip().lower()
+
+def get_col(df, candidates):
+    """
+    후보 문자열 리스트 중 하나라도 '부분 포함'되면 해당 컬럼명을 반환.
+    - 대소문자/공백 무시
+    """
+    cols = list(df.columns)
+    norm_cols = [normalize_colname(c) for c in cols]
+    for cand in candidates:
+        target = normalize_colname(cand)
+        for orig, norm in zip(cols, norm_cols):
+            if target in norm:
+                return orig
+    return None
+
+def parse_number(x):
+    """
+    문자열 수치 안전 변환:
+    - 공백/콤마 제거, % 포함 시 /100
+    - 빈칸/하이픈 등은 None
+    """
+    if x is None:
+        return None
+    s = str(x).strip()
+    if s == "" or s in {"-", "—", "NaN", "nan"}:
+        return None
+    is_percent = "%" in s
+    s = s.replace(",", "").replace("%", "")
+    try:
+        val = float(s)
+        if is_percent:
+            val = val / 100.0
+        return val
+    except Exception:
+        return None
+
+def value_from_any(dfs, candidates, row_masks):
+    """여러 df/마스크에서 후보 컬럼을 찾아 값 하나 반환"""
+    for df, m in zip(dfs, row_masks):
+        if df is None or m is None or not m.any():
+            continue
+        col = get_col(df, candidates)
+        if col:
+            try:
+                return parse_number(df.loc[m].iloc[0][col])
+            except Exception:
+                continue
+    return None
+
+# ============== 분할 정합성 검증 ==============
+# 같은 선수의 분할 파일 합계는 최종성적 합계와 같아야 한다.
+# 그룹별 분할 파일, 최종성적 파일, {분할 컬럼: 최종성적 컬럼} 매핑
+SPLIT_CHECKS = {
+    "타자": {
+        "groups": {
+            "주자": ["타자_주자있음.xlsx", "타자_주자없음.xlsx"],
+            "이닝": ["타자_1~3회.xlsx", "타자_4~6회.xlsx", "타자_7회이후.xlsx"],
+            "월":   ["타자_3~4월.xlsx", "타자_5월.xlsx", "타자_6월.xlsx",
+                     "타자_7월.xlsx", "타자_8월.xlsx", "타자_9월이후.xlsx"],
+        },
+        "totals": ["타자_최종성적1.xlsx", "타자_최종성적2.xlsx"],
+        "metrics": {
+            "타수":"타수", "안타":"안타", "2루타":"2루타", "3루타":"3루타", "홈런":"홈런",
+            "타점":"타점", "볼넷":"볼넷", "몸에맞는볼":"몸에맞는볼", "삼진":"삼진", "병살타":"병살타",
+        },
+    },
+    "투수": {
+        "groups": {
+            "주자": ["투수_주자있음.xlsx", "투수_주자없음.xlsx"],
+            "이닝": ["투수_1~3회.xlsx", "투수_4~6회.xlsx", "투수_7회이후.xlsx"],
+            "월":   ["투수_3~4월.xlsx", "투수_5월.xlsx", "투수_6월.xlsx",
+                     "투수_7월.xlsx", "투수_8월.xlsx", "투수_9월이후.xlsx"],
+        },
+        "totals": ["투수_최종성적1.xlsx", "투수_최종성적2.xlsx"],
+        "metrics": {
+            "피안타":"피안타", "2루타":"2루타", "3루타":"3루타", "홈런":"피홈런", "볼넷":"볼넷",
+            "사구":"몸에맞는볼", "삼진":"삼진",
+        },  # 폭투/보크는 타석 단위 분할에 잡히지 않는 경우가 있어 제외
+    },
+}
+
+def counts_frame(path, colmap):
+    """파일을 [선수, 지표...] 숫자 프레임으로 변환 (colmap: {파일 컬럼: 지표명}, 정확 일치)"""
+    df = read_xlsx(path)
+    by_norm = {normalize_colname(c): c for c in df.columns[1:]}
+    out = pd.DataFrame({"선수": df.iloc[:, 0].astype(str).str.strip()})
+    for src, key in colmap.items():
+        col = by_norm.get(normalize_colname(src))
+        if col is not None:
+            out[key] = df[col].map(parse_number).astype(float)
+    return out[df.iloc[:, 0].notna().to_numpy()]
+
+def check_splits(position, file_paths):
+    """
+    분할 그룹 합계 vs 최종성적 합계를 전 선수 대상으로 한 번의 group-by로 비교.
+    - 반환: (불일치 리포트 DataFrame, 격리 대상 {경로: 선수 튜플})
+    - 격리는 (파일, 선수) 행 단위: 모든 그룹에서 어긋나는 (선수, 지표)는 그 지표가 있는 최종성적 파일의
+      해당 선수 행을, 일부 그룹만 어긋나면 그 그룹 파일들의 해당 선수 행을 의심
+    - 읽지 못한 파일, 지표 열이 빠진 분할 파일은 리포트의 '비고'에 기록 (빠진 (그룹, 지표)는 비교 제외)
+    """
+    spec = SPLIT_CHECKS[position]
+    metrics = list(spec["metrics"])
+    report_cols = ["그룹", "선수", "지표", "분할 합", "최종성적", "차이", "비고"]
+
+    notes = []
+    def safe_frame(path, colmap, group="최종성적"):
+        try:
+            return counts_frame(path, colmap)
+        except Exception:
+            notes.append({"그룹": group, "선수": "-", "지표": "-", "비고": f"{os.path.basename(path)} 읽기 실패"})
+            return None
+    def finish(report=None, quarantined=()):
+        frames = [f for f in (report, pd.DataFrame(notes, columns=report_cols)) if f is not None and len(f)]
+        report = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=report_cols)
+        return report, {p: tuple(sorted(v)) for p, v in (quarantined or {}).items()}
+
+    total_paths = [p for p in (find_path(file_paths, f) for f in spec["totals"]) if p]
+    total_frames = [safe_frame(p, {v: k for k, v in spec["metrics"].items()}) for p in total_paths]
+    metric_source = {}  # 지표 → 그 지표를 가진 첫 최종성적 파일
+    for p, f in zip(total_paths, total_frames):
+        if f is not None:
+            for m in f.columns[1:]:
+                metric_source.setdefault(m, p)
+    total_frames = [f for f in total_frames if f is not None]
+    if not total_frames:
+        return finish()
+    totals = pd.concat(total_frames, ignore_index=True).groupby("선수").sum(min_count=1)
+    metrics = [m for m in metrics if m in totals.columns]
+
+    group_paths, split_frames, missing = {}, [], set()
+    for group, fnames in spec["groups"].items():
+        group_paths[group] = [p for p in (find_path(file_paths, f) for f in fnames) if p]
+        for p in group_paths[group]:
+            f = safe_frame(p, {k: k for k in metrics}, group)
+            if f is None:
+                continue
+            for m in metrics:
+                if m not in f.columns:
+                    missing.add((group, m))
+                    notes.append({"그룹": group, "선수": "-", "지표": m,
+                                  "비고": f"{os.path.basename(p)}에 '{m}' 열 없음 — 비교 제외"})
+            split_frames.append(f.assign(그룹=group))
+    if not split_frames:
+        return finish()
+    split = pd.concat(split_frames, ignore_index=True)
+    metrics = [m for m in metrics if m in split.columns]  # 모든 분할 파일에 없는 지표는 비교 불가
+    if not metrics:
+        return finish()
+
+    split_sum = split.groupby(["그룹", "선수"])[metrics].sum()
+    groups = sorted(split_sum.index.get_level_values("그룹").unique())
+    players = totals.index  # 최종성적 명단 밖(기준 미달) 선수는 비교 대상 아님
+    idx = pd.MultiIndex.from_product([groups, players], names=["그룹", "선수"])
+    split_sum = split_sum.reindex(idx, fill_value=0.0)
+    for group, m in missing:
+        if m in split_sum.columns and group in groups:
+            split_sum.loc[group, m] = np.nan
+    expected = totals[metrics].reindex(idx.get_level_values("선수")).set_axis(idx)
+
+    diff = split_sum - expected
+    bad = diff.abs() > 0.5
+    if not bad.to_numpy().any():
+        return finish()
+
+    report = pd.DataFrame({"분할 합": split_sum.stack(), "최종성적": expected.stack(), "차이": diff.stack()})
+    report = report[bad.stack().reindex(report.index, fill_value=False)]
+    report = report.rename_axis(["그룹", "선수", "지표"]).reset_index()
+    report["비고"] = None
+
+    blame_totals = bad.groupby(level="선수").all() & (len(groups) > 1)
+    blame_groups = bad & ~blame_totals.reindex(idx.get_level_values("선수")).set_axis(idx)
+    quarantined = {}
+    totals_rows = blame_totals.stack()
+    for player, m in totals_rows[totals_rows].index:
+        quarantined.setdefault(metric_source[m], set()).add(player)
+    group_rows = blame_groups.any(axis=1)
+    for group, player in group_rows[group_rows].index:
+        for p in group_paths[group]:
+            quarantined.setdefault(p, set()).add(player)
+    return finish(report[report_cols], quarantined)
+
+# ============== 유사 선수 검색 ==============
+# 선수 프로필 = 분할 파일별 비율 지표(타자: 타율, 투수: 피안타율) 벡터
+SIMILARITY_MIN_AB = 10         # 분할 표본(타수)이 이보다 적으면 그 분할 값은 결측 처리
+SIMILARITY_MIN_COVERAGE = 0.5  # 채워진 분할 비율이 이보다 낮은 선수는 순위 계산(질의/후보)에서 제외
+
+SIMILARITY_FEATURES = {
+    "타자": {
+        "rate": ["타율", "AVG"],
+        "files": {
+            "득점권": "타자_주자득점권.xlsx", "주자있음": "타자_주자있음.xlsx", "주자없음": "타자_주자없음.xlsx",
+            "1~3회": "타자_1~3회.xlsx", "4~6회": "타자_4~6회.xlsx", "7회이후": "타자_7회이후.xlsx",
+            "3~4월": "타자_3~4월.xlsx", "5월": "타자_5월.xlsx", "6월": "타자_6월.xlsx",
+            "7월": "타자_7월.xlsx", "8월": "타자_8월.xlsx", "9월이후": "타자_9월이후.xlsx",
+        },
+    },
+    "투수": {
+        "rate": ["피안타율", "피타율", "OAVG", "BAA", "AVG"],
+        "files": {
+            "득점권": "투수_주자득점권.xlsx", "주자있음": "투수_주자있음.xlsx", "주자없음": "투수_주자없음.xlsx",
+            "1~3회": "투수_1~3회.xlsx", "4~6회": "투수_4~6회.xlsx", "7회이후": "투수_7회이후.xlsx",
+            "3~4월": "투수_3~4월.xlsx", "5월": "투수_5월.xlsx", "6월": "투수_6월.xlsx",
+            "7월": "투수_7월.xlsx", "8월": "투수_8월.xlsx", "9월이후": "투수_9월이후.xlsx",
+        },
+    },
+}
+
+def split_at_bats(df, rates):
+    """
+    분할 행별 표본 크기(타수).
+    - 타수 열이 없으면(투수 파일) 피안타 / 피안타율로 추정, 피안타율이 0이면 삼진 수(타수의 하한)
+    """
+    by_norm = {normalize_colname(c): c for c in df.columns[1:]}
+    if "타수" in by_norm:
+        return df[by_norm["타수"]].map(parse_number).astype(float).to_numpy()
+    def count(name):
+        col = by_norm.get(name)
+        return df[col].map(parse_number).astype(float).to_numpy() if col is not None else np.full(len(df), np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(rates > 0, count("피안타") / rates, count("삼진"))
+
+def split_feature_matrix(position, file_paths, exclude=None):
+    """
+    선수 × 분할 비율 지표 행렬을 만들고 열별로 표준화.
+    - 반환: (원본 값 DataFrame[선수 × 분할], 표준화 행렬 ndarray — 결측은 NaN)
+    - exclude: {경로: 선수들} — 정합성 격리된 행은 결측으로 취급
+    - 표본이 SIMILARITY_MIN_AB타수 미만인 분할 값도 결측으로 취급
+    - 동명이인은 화면과 같게 첫 행 기준
+    """
+    spec = SIMILARITY_FEATURES[position]
+    cols = {}
+    for label, fname in spec["files"].items():
+        p = find_path(file_paths, fname)
+        if not p:
+            continue
+        df = read_xlsx(p)
+        c = get_col(df, spec["rate"])
+        if not c:
+            continue
+        named = df.iloc[:, 0].notna().to_numpy()
+        rates = np.array(df[c].map(parse_number), dtype=float)
+        rates[~(split_at_bats(df, rates) >= SIMILARITY_MIN_AB)] = np.nan
+        s = pd.Series(rates[named], index=df.iloc[:, 0][named].astype(str).str.strip())
+        cols[label] = s.groupby(level=0).first().drop(list((exclude or {}).get(p, ())), errors="ignore")
+    raw = pd.DataFrame(cols).sort_index()
+    if raw.empty:
+        return raw, np.zeros((0, 0))
+
+    values = raw.to_numpy(dtype=float)
+    mean = np.nanmean(values, axis=0)
+    std = np.nanstd(values, axis=0)
+    std[~(std > 0)] = 1.0
+    z = (values - mean) / std
+    return raw, z
+
+def nearest_players(raw, z, player_name, k=5, min_coverage=SIMILARITY_MIN_COVERAGE):
+    """
+    표준화 벡터의 유클리드 거리 기준 가장 가까운 k명 (자기 자신 제외).
+    - 채워진 분할 비율이 min_coverage 미만인 선수는 질의/후보 모두 제외(빈 결과)
+    - 거리는 두 선수가 함께 가진 분할만으로 계산해 전체 분할 수 기준으로 환산
+    """
+    empty = pd.DataFrame(columns=["선수", "거리"] + list(raw.columns))
+    if player_name not in raw.index:
+        return empty
+    coverage = raw.notna().mean(axis=1).to_numpy()
+    i = raw.index.get_loc(player_name)
+    if coverage[i] < min_coverage:
+        return empty
+    sq = (z - z[i]) ** 2
+    shared = (~np.isnan(sq)).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dist = np.sqrt(np.nansum(sq, axis=1) * z.shape[1] / shared)
+    dist[(coverage < min_coverage) | (shared == 0)] = np.inf
+    dist[i] = np.inf
+    k = min(k, int(np.isfinite(dist).sum()))
+    if k <= 0:
+        return empty
+    top = np.argpartition(dist, k - 1)[:k]
+    top = top[np.argsort(dist[top])]
+    out = raw.iloc[top].rename_axis("선수").reset_index()
+    out.insert(1, "거리", dist[top])
+    return out
+
+def feature_percentiles(raw, player_name):
+    """선수의 분할별 리그 내 백분위(0~100, 결측은 NaN)"""
+    if player_name not in raw.index:
+        return pd.Series(dtype=float)
+    return raw.rank(pct=True).loc[player_name] * 100
+
+# ============== 스냅샷 ==============
+# 파싱/검증이 끝난 상태 전체를 파일 하나로 직렬화해 새 프로세스가 바로 서빙할 수 있게 한다.
+# 파일 = 헤더 피클(version, libs, sources) + 본문 피클(아래 전체). 헤더가 안 맞으면 본문은 읽지 않는다.
+#   version  : 포맷 버전 (바뀌면 기존 스냅샷은 무시하고 재빌드)
+#   libs     : 빌드 시 pandas/numpy 버전 — DataFrame 피클은 버전 간 호환이 보장되지 않으므로 다르면 재빌드
+#   sources  : {파일명: sha256} — 하나라도 다르면 재빌드
+#   sheets   : {파일명: read_xlsx 결과 DataFrame}
+#   names    : {파일명: 선수명 리스트}
+#   broken   : 파싱 실패 파일명 리스트
+#   splits   : {포지션: (정합성 리포트, 격리 대상 {파일명: 선수 리스트})}
+# 로드는 본문 전체를 힙으로 역직렬화한다(메모리 매핑 아님). 아끼는 것은 openpyxl 파싱과 검증뿐이고,
+# 시트는 read_excel 결과 그대로라 숫자 변환(parse_number)과 뷰 계산은 여전히 조회 시점에 돈다
+# (뷰 결과는 앱의 st.cache_data가 캐시).
+SNAPSHOT_VERSION = 3
+SNAPSHOT_LIBS = {"pandas": pd.__version__, "numpy": np.__version__}
+SNAPSHOT_PATH = os.path.join(APP_DIR, "data", "stat_store.snapshot")
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def source_hashes(paths):
+    return {os.path.basename(p): file_sha256(p) for p in paths}
+
+def build_snapshot(hitter_paths, pitcher_paths, out_path=SNAPSHOT_PATH):
+    """원본 xlsx를 모두 파싱/검증해 스냅샷 dict를 만들고 out_path에 기록(실패해도 dict는 반환)"""
+    all_paths = list(hitter_paths) + list(pitcher_paths)
+    SHEETS.clear()
+    sheets, names, broken = {}, {}, []
+    for p in all_paths:
+        name = os.path.basename(p)
+        try:
+            df = read_xlsx(p)
+        except Exception:
+            broken.append(name)
+            continue
+        sheets[name] = df
+        names[name] = first_col_strip(df).tolist()
+
+    snap = {
+        "version": SNAPSHOT_VERSION,
+        "libs": SNAPSHOT_LIBS,
+        "sources": source_hashes(all_paths),
+        "sheets": sheets,
+        "names": names,
+        "broken": broken,
+    }
+    install_snapshot(snap, all_paths)
+    snap["splits"] = {}
+    for position, paths in [("타자", hitter_paths), ("투수", pitcher_paths)]:
+        report, quarantined = check_splits(position, tuple(paths))
+        snap["splits"][position] = (report, {os.path.basename(p): list(v) for p, v in quarantined.items()})
+
+    if out_path:
+        try:
+            os.makedirs(os.path.dirname(out_path), exist_ok=True)
+            tmp = f"{out_path}.{os.getpid()}.tmp"
+            header = {k: snap[k] for k in ("version", "libs", "sources")}
+            with open(tmp, "wb") as f:
+                pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(snap, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, out_path)
+        except OSError:
+            pass  # 읽기 전용 배포 등 — 메모리 상태만으로 서빙
+    return snap
+
+def snapshot_header_ok(header, paths):
+    """헤더의 포맷 버전, 라이브러리 버전, 소스 해시가 현재 환경과 모두 같은지"""
+    return (
+        isinstance(header, dict)
+        and header.get("version") == SNAPSHOT_VERSION
+        and header.get("libs") == SNAPSHOT_LIBS
+        and header.get("sources") == source_hashes(paths)
+    )
+
+def load_snapshot(paths, path=SNAPSHOT_PATH):
+    """
+    헤더가 맞을 때만 본문을 읽어 반환, 아니면 None.
+    - 본문 역직렬화 중 어떤 예외든(다른 pandas/numpy로 만든 피클의 ModuleNotFoundError 등) 낡은 스냅샷으로 취급
+    """
+    try:
+        with open(path, "rb") as f:
+            if not snapshot_header_ok(pickle.load(f), paths):
+                return None
+            snap = pickle.load(f)
+    except Exception:
+        return None
+    return snap if isinstance(snap, dict) else None
+
+def install_snapshot(snap, paths):
+    """스냅샷 시트를 현재 경로에 매핑해 read_xlsx가 파싱 없이 쓰도록 등록"""
+    SHEETS.clear()
+    for p in paths:
+        df = snap["sheets"].get(os.path.basename(p))
+        if df is not None:
+            SHEETS[p] = df
+
+def load_or_build(hitter_paths, pitcher_paths, path=None):
+    """
+    해시가 맞는 스냅샷이 있으면 올리고, 없거나 낡았으면 다시 빌드.
+    - path가 None이면 호출 시점의 SNAPSHOT_PATH, 빈 문자열이면 스냅샷 없이 xlsx를 파싱(기록도 안 함)
+    """
+    path = SNAPSHOT_PATH if path is None else path
+    all_paths = list(hitter_paths) + list(pitcher_paths)
+    snap = load_snapshot(all_paths, path) if path else None
+    if snap is None:
+        return build_snapshot(hitter_paths, pitcher_paths, path)
+    install_snapshot(snap, all_paths)
+    return snap
+
+def player_names(snap, paths):
+    """스냅샷 기준 (정렬된 선수명 리스트, 파싱 실패 파일명 리스트)"""
+    names = set()
+    for p in paths:
+        names.update(snap["names"].get(os.path.basename(p), []))
+    broken = [os.path.basename(p) for p in paths if os.path.basename(p) in snap["broken"]]
+    return sorted(names), broken
+
+def split_check(snap, position, paths):
+    """스냅샷의 정합성 결과를 (리포트, 현재 경로 기준 {경로: 격리 선수 frozenset})로 반환"""
+    report, quarantined = snap["splits"][position]
+    return report, {p: frozenset(quarantined[os.path.basename(p)])
+                    for p in paths if os.path.basename(p) in quarantined}
+
+def quarantine_enabled():
+    """
+    환경변수 QUARANTINE_BAD_SPLITS가 0/false/no/off면 격리하지 않음 (기본: 격리).
+    - Streamlit Cloud에선 secrets의 최상위 키도 환경변수로 노출되므로 secrets로도 설정 가능
+    """
+    return os.environ.get("QUARANTINE_BAD_SPLITS", "1").strip().lower() not in ("0", "false", "no", "off")
+
+def served_paths(paths, quarantined, player_name):
+    """선수별 서빙 경로 — 그 선수 행이 격리된 파일만 제외"""
+    return [p for p in paths if player_name not in quarantined.get(p, ())]
+
+def held_paths(paths, quarantined, player_name):
+    """served_paths에서 빠진 경로(그 선수 행이 격리된 파일) — 뷰의 격리 안내용"""
+    return [p for p in paths if player_name in quarantined.get(p, ())]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="스탯 스냅샷 빌드")
+    parser.add_argument("--out", default=SNAPSHOT_PATH, help="스냅샷 파일 경로")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    snap = build_snapshot(HITTER_PATHS, PITCHER_PATHS, args.out)
+    print(f"{args.out}: 시트 {len(snap['sheets'])}개, 실패 {len(snap['broken'])}개 ({time.perf_counter() - t0:.2f}s)")
+    for position, (report, quarantined) in snap["splits"].items():
+        if len(report) or quarantined:
+            rows = ", ".join(f"{name}({len(v)}명)" for name, v in quarantined.items()) or "없음"
+            print(f"  {position} 정합성 불일치 {len(report)}건, 격리 대상 행: {rows}")
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,20 @@
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from glob import glob
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
-import altair as alt
+
+from stat_store import (
+    HITTER_PATHS, PITCHER_PATHS, files_signature,
+    load_or_build, player_names, split_check, quarantine_enabled, served_paths, held_paths,
+    split_feature_matrix, nearest_players, feature_percentiles, SIMILARITY_MIN_AB, SIMILARITY_MIN_COVERAGE,
+)
+from views import (
+    DETAILS, MONTH_OPTIONS, INNING_OPTIONS,
+    view_parts, compute_part, horizontal_row_from_df, section_bar_chart, section_trend_chart, trend_table,
+)
 
 # ============== 기본 설정 ==============
 st.set_page_config(page_title="2025 시즌 스탯 시각화", layout="wide")
@@ -18,164 +30,55 @@ except Exception as e:
     )
     st.stop()
 
-# ============== 파일 경로 ==============
-APP_DIR = os.path.dirname(os.path.abspath(__file__))
-SEARCH_DIRS = [APP_DIR, os.path.join(APP_DIR, "data")]
-
-HITTER_FILES = [
-    "2025_타자_1~3회.xlsx",
-    "2025_타자_3~4월.xlsx",
-    "2025_타자_4~6회.xlsx",
-    "2025_타자_5월.xlsx",
-    "2025_타자_6월.xlsx",
-    "2025_타자_7월.xlsx",
-    "2025_타자_7회이후.xlsx",
-    "2025_타자_8월.xlsx",
-    "2025_타자_9월이후.xlsx",
-    "2025_타자_주자득점권.xlsx",
-    "2025_타자_주자없음.xlsx",
-    "2025_타자_주자있음.xlsx",
-    "2025_타자_최종성적1.xlsx",
-    "2025_타자_최종성적2.xlsx",
-]
-
-PITCHER_FILES = [
-    "2025_투수_1~3회.xlsx",
-    "2025_투수_3~4월.xlsx",
-    "2025_투수_4~6회.xlsx",
-    "2025_투수_5월.xlsx",
-    "2025_투수_6월.xlsx",
-    "2025_투수_7월.xlsx",
-    "2025_투수_7회이후.xlsx",
-    "2025_투수_8월.xlsx",
-    "2025_투수_9월이후.xlsx",
-    "2025_투수_주자득점권.xlsx",
-    "2025_투수_주자없음.xlsx",
-    "2025_투수_주자있음.xlsx",
-    "2025_투수_최종성적1.xlsx",
-    "2025_투수_최종성적2.xlsx",
-    "2025_투수_최종성적3.xlsx",
-    "2025_투수_최종성적4.xlsx",
-]
-
-def resolve_existing_paths(filenames):
-    found = []
-    for name in filenames:
-        for d in SEARCH_DIRS:
-            p = os.path.join(d, name)
-            if os.path.exists(p):
-                found.append(p)
-                break
-    return list(dict.fromkeys(found))
-
-HITTER_PATHS = resolve_existing_paths(HITTER_FILES)
-PITCHER_PATHS = resolve_existing_paths(PITCHER_FILES)
-
-# ============== 유틸 ==============
-def read_xlsx(path):
-    return pd.read_excel(path, engine="openpyxl")
-
-def first_col_strip(df):
-    """첫 번째 열(선수명)만 공백 strip 후 반환"""
-    return df.iloc[:, 0].dropna().astype(str).map(lambda x: x.strip())
-
-def normalize_colname(s: str) -> str:
-    """컬럼명 비교용 정규화(소문자, 양쪽 공백 제거)"""
-    return str(s).strip().lower()
-
-def get_col(df, candidates):
+# ============== 스탯 스토어 (스냅샷) ==============
+@st.cache_resource(show_spinner=False, max_entries=1)
+def load_store(signature):
     """
-    후보 문자열 리스트 중 하나라도 '부분 포함'되면 해당 컬럼명을 반환.
-    - 대소문자/공백 무시
+    소스 해시가 맞는 스냅샷이 있으면 읽어 올리고, 아니면 다시 빌드.
+    - signature(워크북 수정시각/크기)는 캐시 키 용도 — 파일이 바뀌면 재확인
+    - max_entries=1: 워크북이 바뀌면 이전 시트 사본은 버림
     """
-    cols = list(df.columns)
-    norm_cols = [normalize_colname(c) for c in cols]
-    for cand in candidates:
-        target = normalize_colname(cand)
-        for orig, norm in zip(cols, norm_cols):
-            if target in norm:
-                return orig
-    return None
+    return load_or_build(HITTER_PATHS, PITCHER_PATHS)
 
-def parse_number(x):
-    """
-    문자열 수치 안전 변환:
-    - 공백/콤마 제거, % 포함 시 /100
-    - 빈칸/하이픈 등은 None
-    """
-    if x is None:
-        return None
-    s = str(x).strip()
-    if s == "" or s in {"-", "—", "NaN", "nan"}:
-        return None
-    is_percent = "%" in s
-    s = s.replace(",", "").replace("%", "")
-    try:
-        val = float(s)
-        if is_percent:
-            val = val / 100.0
-        return val
-    except Exception:
-        return None
+STORE = load_store(files_signature(HITTER_PATHS + PITCHER_PATHS))
 
-def value_from_any(dfs, candidates, row_masks):
-    """여러 df/마스크에서 후보 컬럼을 찾아 값 하나 반환"""
-    for df, m in zip(dfs, row_masks):
-        if df is None or m is None or not m.any():
-            continue
-        col = get_col(df, candidates)
-        if col:
-            try:
-                return parse_number(df.loc[m].iloc[0][col])
-            except Exception:
-                continue
-    return None
+QUARANTINE_BAD_SPLITS = quarantine_enabled()  # 불일치 (파일, 선수) 행을 서빙에서 제외할지 (환경변수로 끔)
 
-# ============== 공통: 차트 / 표 유틸 ==============
-def bar_with_labels(data, x_field, y_field, y_fmt, height=350):
-    base = alt.Chart(data).encode(
-        x=alt.X(f"{x_field}:N", sort=None, title=None, axis=alt.Axis(labelAngle=0)),
-        y=alt.Y(f"{y_field}:Q", title=None),
-        tooltip=[x_field, alt.Tooltip(f"{y_field}:Q", format=y_fmt)],
-    )
-    bars = base.mark_bar()
-    labels = base.mark_text(dy=-5).encode(text=alt.Text(f"{y_field}:Q", format=y_fmt))
-    return (bars + labels).properties(height=height).interactive()
+H_SPLIT_REPORT, H_QUARANTINED = split_check(STORE, "타자", HITTER_PATHS)
+P_SPLIT_REPORT, P_QUARANTINED = split_check(STORE, "투수", PITCHER_PATHS)
 
-def horizontal_row_from_df(df: pd.DataFrame, k_col="지표", v_col="값", is_rate=False):
-    """한 줄 가로 테이블 생성(카운팅: 정수, 비율: 소수3)"""
-    row = {}
-    for _, r in df.iterrows():
-        if is_rate:
-            val = 0.000 if pd.isna(r[v_col]) else round(float(r[v_col]), 3)
-        else:
-            val = 0 if pd.isna(r[v_col]) else int(round(r[v_col]))
-        row[str(r[k_col])] = val
-    return pd.DataFrame([row])
+def player_paths(position, player_name):
+    """(선수에게 서빙할 파일 경로, 그 선수 행이 격리돼 빠진 경로)"""
+    if position == "투수":
+        paths, quarantined = PITCHER_PATHS, P_QUARANTINED
+    else:
+        paths, quarantined = HITTER_PATHS, H_QUARANTINED
+    if not QUARANTINE_BAD_SPLITS:
+        return paths, []
+    return served_paths(paths, quarantined, player_name), held_paths(paths, quarantined, player_name)
 
 # ============== 선수명 로딩 ==============
-@st.cache_data(show_spinner=False)
-def load_player_names(file_paths):
-    names = set()
-    broken = []
-    for p in file_paths:
-        try:
-            df = read_xlsx(p)
-            names.update(first_col_strip(df).tolist())
-        except Exception:
-            broken.append(os.path.basename(p))
-    return sorted(names), broken
-
-HITTER_PLAYERS, BROKEN_H = load_player_names(tuple(HITTER_PATHS))
-PITCHER_PLAYERS, BROKEN_P = load_player_names(tuple(PITCHER_PATHS))
+HITTER_PLAYERS, BROKEN_H = player_names(STORE, HITTER_PATHS)
+PITCHER_PLAYERS, BROKEN_P = player_names(STORE, PITCHER_PATHS)
 
 # ============== 사이드바 ==============
 st.sidebar.title("설정")
 
+for label, report, quarantined in [("타자", H_SPLIT_REPORT, H_QUARANTINED), ("투수", P_SPLIT_REPORT, P_QUARANTINED)]:
+    if report.empty and not quarantined:
+        continue
+    rows = ", ".join(f"{os.path.basename(p)}({len(v)}명)" for p, v in quarantined.items()) or "없음"
+    st.sidebar.warning(
+        f"{label} 분할 정합성 불일치 {len(report)}건\n\n"
+        f"{'격리된' if QUARANTINE_BAD_SPLITS else '의심'} 행: {rows}"
+    )
+    with st.sidebar.expander(f"{label} 불일치 리포트"):
+        st.dataframe(report, use_container_width=True, hide_index=True)
+
 position = st.sidebar.radio("선수 포지션", ["투수", "타자"], index=1)  # 기본 타자
 detail = st.sidebar.radio(
     "세부사항 (하나만 선택)",
-    ["주자 득점권", "세부사항 없음", "주자 있음", "주자 없음", "이닝별", "월별"],
+    DETAILS,
     index=0,  # 요청대로 '주자 득점권'을 맨 앞에 배치
 )
 
@@ -183,11 +86,11 @@ month_selection = None
 inning_selection = None
 if detail == "월별":
     month_selection = st.sidebar.select_slider(
-        "월 선택", options=["3~4월", "5월", "6월", "7월", "8월", "9이후"], value="3~4월"
+        "월 선택", options=MONTH_OPTIONS, value="3~4월"
     )
 elif detail == "이닝별":
     inning_selection = st.sidebar.select_slider(
-        "이닝 선택", options=["1~3이닝", "4~6이닝", "7이후"], value="1~3이닝"
+        "이닝 선택", options=INNING_OPTIONS, value="1~3이닝"
     )
 
 # ============== 메인 타이틀 / 검색 ==============
@@ -205,607 +108,115 @@ if query:
 st.markdown("---")
 st.subheader("스탯 시각화")
 
-# ==================== 타자 · 세부사항 없음 + 월별 추이(타율) ====================
-def visualize_batter_overall(player_name: str):
-    f1 = next((p for p in HITTER_PATHS if p.endswith("타자_최종성적1.xlsx")), None)
-    f2 = next((p for p in HITTER_PATHS if p.endswith("타자_최종성적2.xlsx")), None)
-    if not f1 or not f2:
-        st.error("타자 최종성적 파일(1,2)을 찾을 수 없습니다.")
-        return
-
-    df1 = read_xlsx(f1); df2 = read_xlsx(f2)
-    m1 = first_col_strip(df1) == player_name
-    m2 = first_col_strip(df2) == player_name
-    if not m1.any() and not m2.any():
-        st.info("선택한 선수를 최종성적 파일에서 찾지 못했습니다.")
-        return
-
-    ab   = value_from_any([df1],[ "타수"],[m1])
-    r    = value_from_any([df1],[ "득점"],[m1])
-    h    = value_from_any([df1],[ "안타"],[m1])
-    hr   = value_from_any([df1],[ "홈런"],[m1])
-    rbi  = value_from_any([df1],[ "타점"],[m1])
-    avg  = value_from_any([df1],[ "타율"],[m1])
-
-    bb   = value_from_any([df2],[ "볼넷"],[m2]) or 0
-    ibb  = value_from_any([df2],[ "고의4구","고의 사구","고의4"],[m2]) or 0
-    hbp  = value_from_any([df2],[ "몸에맞는볼","사구"],[m2]) or 0
-    so   = value_from_any([df2],[ "삼진"],[m2])
-    gidp = value_from_any([df2],[ "병살","병살타"],[m2])
-    slg  = value_from_any([df2],[ "장타율"],[m2])
-    obp  = value_from_any([df2],[ "출루율"],[m2])
-    ops  = value_from_any([df2],[ "ops","OPS","OPS(출+장)","ops(출+장)"],[m2])
-    risp = value_from_any([df2],[ "득점권","득점권 타율","득점권타율"],[m2])
-
-    bb_sum = (bb or 0) + (ibb or 0) + (hbp or 0)
-
-    st.metric("타율", "N/A" if avg is None else f"{avg:.3f}")
-
-    counting_df = pd.DataFrame([{"지표": k, "값": v if v is not None else 0} for k, v in {
-        "타수":ab,"득점":r,"안타":h,"홈런":hr,"타점":rbi,"볼넷":bb_sum,"삼진":so,"병살타":gidp
-    }.items()])
-    rate_df = pd.DataFrame([{"지표": k, "값": v if v is not None else 0} for k, v in {
-        "출루율":obp,"장타율":slg,"OPS(출+장)":ops,"득점권 타율":risp
-    }.items()])
-
-    c1,c2=st.columns(2)
-    with c1:
-        st.markdown(f"#### {player_name} — 카운팅 스탯")
-        st.altair_chart(bar_with_labels(counting_df, "지표", "값", ",.0f", height=350), use_container_width=True)
-        st.caption("카운팅 스탯 (가로형)")
-        st.dataframe(horizontal_row_from_df(counting_df, is_rate=False), use_container_width=True, hide_index=True)
-
-    with c2:
-        st.markdown(f"#### {player_name} — 비율/OPS")
-        chart = bar_with_labels(rate_df, "지표", "값", ".3f", height=350).encode(
-            y=alt.Y("값:Q", title=None, scale=alt.Scale(domain=[0,2]))
-        )
-        st.altair_chart(chart, use_container_width=True)
-        st.caption("비율/OPS (가로형)")
-        st.dataframe(horizontal_row_from_df(rate_df, is_rate=True), use_container_width=True, hide_index=True)
-
-def visualize_batter_monthly_avg(player_name: str):
-    month_defs = [
-        ("타자_3~4월.xlsx","3~4월"),("타자_5월.xlsx","5월"),("타자_6월.xlsx","6월"),
-        ("타자_7월.xlsx","7월"),("타자_8월.xlsx","8월"),("타자_9월이후.xlsx","9월이후"),
-    ]
-    rows=[]
-    for fname,label in month_defs:
-        p = next((x for x in HITTER_PATHS if x.endswith(fname)), None)
-        if not p: continue
-        df = read_xlsx(p)
-        m = first_col_strip(df)==player_name
-        if m.any():
-            c = get_col(df,["타율"])
-            val = parse_number(df.loc[m].iloc[0][c]) if c else None
-            rows.append({"월":label,"타율":val})
-    if not rows:
-        st.info("월별 타율 데이터를 찾지 못했습니다."); return
-    trend_df = pd.DataFrame(rows)
-    order=[x[1] for x in month_defs]
-    trend_df["월"]=pd.Categorical(trend_df["월"],categories=order,ordered=True)
-    trend_df=trend_df.sort_values("월")
-    st.markdown("#### 월별 추이 — 타율")
-    st.altair_chart(
-        alt.Chart(trend_df).mark_line(point=True).encode(
-            x=alt.X("월:N", sort=order, axis=alt.Axis(labelAngle=0), title=None),
-            y=alt.Y("타율:Q", title=None, scale=alt.Scale(domain=[0,1])),
-            tooltip=[alt.Tooltip("월:N"), alt.Tooltip("타율:Q", format=".3f")]
-        ).properties(height=320).interactive()
-    , use_container_width=True)
-
-# ==================== 타자 · 주자 있음/없음 ====================
-def visualize_batter_onbase(player_name: str, has_runner: bool):
-    """주자 있음/없음: 타율 메트릭(맨 위) → 막대 → 가로형 표"""
-    suffix = "타자_주자있음.xlsx" if has_runner else "타자_주자없음.xlsx"
-    path = next((p for p in HITTER_PATHS if p.endswith(suffix)), None)
-    if not path:
-        st.error(f"{suffix} 파일을 찾을 수 없습니다.")
-        return
-
-    df = read_xlsx(path)
-    mask = first_col_strip(df) == player_name
-    if not mask.any():
-        st.info("선택한 선수를 해당 파일에서 찾지 못했습니다.")
-        return
-
-    ab  = value_from_any([df], ["타수"], [mask]) or 0
-    h   = value_from_any([df], ["안타"], [mask]) or 0
-    d2  = value_from_any([df], ["2루타","2B","2루"], [mask]) or 0
-    d3  = value_from_any([df], ["3루타","3B","3루"], [mask]) or 0
-    hr  = value_from_any([df], ["홈런","HR"], [mask]) or 0
-    rbi = value_from_any([df], ["타점"], [mask]) or 0
-    bb  = value_from_any([df], ["볼넷","BB"], [mask]) or 0
-    hbp = value_from_any([df], ["몸에맞는볼","사구","HBP"], [mask]) or 0
-    so  = value_from_any([df], ["삼진","SO","K"], [mask]) or 0
-    gd  = value_from_any([df], ["병살","병살타","GIDP"], [mask]) or 0
-    avg = value_from_any([df], ["타율","AVG"], [mask])
-
-    bb_sum = (bb or 0) + (hbp or 0)
-
-    title = "주자 있음" if has_runner else "주자 없음"
-    st.markdown(f"#### {player_name} — {title}")
-    st.metric(f"{title} — 타율", "N/A" if avg is None else f"{avg:.3f}")
-
-    bar_df = pd.DataFrame([
-        {"지표":"타수","값":ab},
-        {"지표":"안타","값":h},
-        {"지표":"2루타","값":d2},
-        {"지표":"3루타","값":d3},
-        {"지표":"홈런","값":hr},
-        {"지표":"타점","값":rbi},
-        {"지표":"볼넷","값":bb_sum},
-        {"지표":"삼진","값":so},
-        {"지표":"병살타","값":gd},
-    ])
-    st.altair_chart(bar_with_labels(bar_df, "지표", "값", ",.0f", height=340), use_container_width=True)
-    st.caption(f"{title} — 카운팅 스탯 (가로형)")
-    st.dataframe(horizontal_row_from_df(bar_df, is_rate=False), use_container_width=True, hide_index=True)
-
-# ==================== 타자 · 주자 득점권 ====================
-def visualize_batter_risp(player_name: str):
-    """주자 득점권: 득점권 타율 메트릭(맨 위) → 막대 → 가로형 표"""
-    path = next((p for p in HITTER_PATHS if p.endswith("타자_주자득점권.xlsx")), None)
-    if not path:
-        st.error("타자_주자득점권.xlsx 파일을 찾을 수 없습니다.")
-        return
-
-    df = read_xlsx(path)
-    mask = first_col_strip(df) == player_name
-    if not mask.any():
-        st.info("선택한 선수를 타자_주자득점권 파일에서 찾지 못했습니다.")
-        return
-
-    ab  = value_from_any([df], ["타수"], [mask]) or 0
-    h   = value_from_any([df], ["안타"], [mask]) or 0
-    d2  = value_from_any([df], ["2루타","2B","2루"], [mask]) or 0
-    d3  = value_from_any([df], ["3루타","3B","3루"], [mask]) or 0
-    hr  = value_from_any([df], ["홈런","HR"], [mask]) or 0
-    rbi = value_from_any([df], ["타점"], [mask]) or 0
-    bb  = value_from_any([df], ["볼넷","BB"], [mask]) or 0
-    hbp = value_from_any([df], ["몸에맞는볼","사구","HBP"], [mask]) or 0
-    so  = value_from_any([df], ["삼진","SO","K"], [mask]) or 0
-    gd  = value_from_any([df], ["병살","병살타","GIDP"], [mask]) or 0
-    risp_avg = value_from_any([df], ["득점권","득점권 타율","득점권타율","타율","AVG"], [mask])
-
-    bb_sum = (bb or 0) + (hbp or 0)
-
-    st.markdown(f"#### {player_name} — 주자 득점권")
-    st.metric("득점권 타율", "N/A" if risp_avg is None else f"{risp_avg:.3f}")
-
-    bar_df = pd.DataFrame([
-        {"지표":"타수","값":ab},
-        {"지표":"안타","값":h},
-        {"지표":"2루타","값":d2},
-        {"지표":"3루타","값":d3},
-        {"지표":"홈런","값":hr},
-        {"지표":"타점","값":rbi},
-        {"지표":"볼넷","값":bb_sum},
-        {"지표":"삼진","값":so},
-        {"지표":"병살타","값":gd},
-    ])
-    st.altair_chart(bar_with_labels(bar_df, "지표", "값", ",.0f", height=340), use_container_width=True)
-    st.caption("주자 득점권 — 카운팅 스탯 (가로형)")
-    st.dataframe(horizontal_row_from_df(bar_df, is_rate=False), use_container_width=True, hide_index=True)
-
-# ==================== 타자 · 이닝별 ====================
-def visualize_batter_inning(player_name: str, inning_label: str):
-    mapping = {
-        "1~3이닝": "타자_1~3회.xlsx",
-        "4~6이닝": "타자_4~6회.xlsx",
-        "7이후":   "타자_7회이후.xlsx",
-    }
-    fname = mapping.get(inning_label)
-    path = next((p for p in HITTER_PATHS if fname and p.endswith(fname)), None)
-    if not path:
-        st.error(f"{inning_label} 파일을 찾을 수 없습니다.")
-        return
-
-    df = read_xlsx(path)
-    mask = first_col_strip(df) == player_name
-    if not mask.any():
-        st.info("선택한 선수를 해당 파일에서 찾지 못했습니다.")
-        return
-
-    ab  = value_from_any([df], ["타수"], [mask]) or 0
-    h   = value_from_any([df], ["안타"], [mask]) or 0
-    d2  = value_from_any([df], ["2루타","2B","2루"], [mask]) or 0
-    d3  = value_from_any([df], ["3루타","3B","3루"], [mask]) or 0
-    hr  = value_from_any([df], ["홈런","HR"], [mask]) or 0
-    rbi = value_from_any([df], ["타점"], [mask]) or 0
-    bb  = value_from_any([df], ["볼넷","BB"], [mask]) or 0
-    hbp = value_from_any([df], ["몸에맞는볼","사구","HBP"], [mask]) or 0
-    so  = value_from_any([df], ["삼진","SO","K"], [mask]) or 0
-    gd  = value_from_any([df], ["병살","병살타","GIDP"], [mask]) or 0
-    avg = value_from_any([df], ["타율","AVG"], [mask])
-
-    bb_sum = (bb or 0) + (hbp or 0)
+# ==================== 뷰 계산 (메모이제이션) ====================
+VIEW_CACHE_ENTRIES = 512  # 세션 공통 LRU 상한 (선수 × 세부사항 × 월/이닝 × 섹션)
 
-    st.markdown(f"#### {player_name} — 이닝별 ({inning_label})")
-    st.metric(f"{inning_label} — 타율", "N/A" if avg is None else f"{avg:.3f}")
-
-    bar_df = pd.DataFrame([
-        {"지표":"타수","값":ab},
-        {"지표":"안타","값":h},
-        {"지표":"2루타","값":d2},
-        {"지표":"3루타","값":d3},
-        {"지표":"홈런","값":hr},
-        {"지표":"타점","값":rbi},
-        {"지표":"볼넷","값":bb_sum},
-        {"지표":"삼진","값":so},
-        {"지표":"병살타","값":gd},
-    ])
-    st.altair_chart(bar_with_labels(bar_df, "지표", "값", ",.0f", height=340), use_container_width=True)
-    st.caption(f"{inning_label} — 카운팅 스탯 (가로형)")
-    st.dataframe(horizontal_row_from_df(bar_df, is_rate=False), use_container_width=True, hide_index=True)
-
-# ==================== 타자 · 월별 ====================
-def visualize_batter_month(player_name: str, month_label: str):
-    mapping = {
-        "3~4월": "타자_3~4월.xlsx",
-        "5월":   "타자_5월.xlsx",
-        "6월":   "타자_6월.xlsx",
-        "7월":   "타자_7월.xlsx",
-        "8월":   "타자_8월.xlsx",
-        "9이후": "타자_9월이후.xlsx",
-    }
-    fname = mapping.get(month_label)
-    path = next((p for p in HITTER_PATHS if fname and p.endswith(fname)), None)
-    if not path:
-        st.error(f"{month_label} 파일을 찾을 수 없습니다.")
-        return
-
-    df = read_xlsx(path)
-    mask = first_col_strip(df) == player_name
-    if not mask.any():
-        st.info("선택한 선수를 해당 파일에서 찾지 못했습니다.")
-        return
-
-    ab  = value_from_any([df], ["타수"], [mask]) or 0
-    h   = value_from_any([df], ["안타"], [mask]) or 0
-    d2  = value_from_any([df], ["2루타","2B","2루"], [mask]) or 0
-    d3  = value_from_any([df], ["3루타","3B","3루"], [mask]) or 0
-    hr  = value_from_any([df], ["홈런","HR"], [mask]) or 0
-    rbi = value_from_any([df], ["타점"], [mask]) or 0
-    bb  = value_from_any([df], ["볼넷","BB"], [mask]) or 0
-    hbp = value_from_any([df], ["몸에맞는볼","사구","HBP"], [mask]) or 0
-    so  = value_from_any([df], ["삼진","SO","K"], [mask]) or 0
-    gd  = value_from_any([df], ["병살","병살타","GIDP"], [mask]) or 0
-    avg = value_from_any([df], ["타율","AVG"], [mask])
-
-    bb_sum = (bb or 0) + (hbp or 0)
-
-    st.markdown(f"#### {player_name} — 월별 ({month_label})")
-    st.metric(f"{month_label} — 타율", "N/A" if avg is None else f"{avg:.3f}")
-
-    bar_df = pd.DataFrame([
-        {"지표":"타수","값":ab},
-        {"지표":"안타","값":h},
-        {"지표":"2루타","값":d2},
-        {"지표":"3루타","값":d3},
-        {"지표":"홈런","값":hr},
-        {"지표":"타점","값":rbi},
-        {"지표":"볼넷","값":bb_sum},
-        {"지표":"삼진","값":so},
-        {"지표":"병살타","값":gd},
-    ])
-    st.altair_chart(bar_with_labels(bar_df, "지표", "값", ",.0f", height=340), use_container_width=True)
-    st.caption(f"{month_label} — 카운팅 스탯 (가로형)")
-    st.dataframe(horizontal_row_from_df(bar_df, is_rate=False), use_container_width=True, hide_index=True)
-
-# ==================== 투수 · 세부사항 없음/주자/이닝/월별 (기존) ====================
-def visualize_pitcher_overall(player_name: str):
-    paths = {
-        "p1": next((p for p in PITCHER_PATHS if p.endswith("투수_최종성적1.xlsx")), None),
-        "p2": next((p for p in PITCHER_PATHS if p.endswith("투수_최종성적2.xlsx")), None),
-        "p3": next((p for p in PITCHER_PATHS if p.endswith("투수_최종성적3.xlsx")), None),
-        "p4": next((p for p in PITCHER_PATHS if p.endswith("투수_최종성적4.xlsx")), None),
-    }
-    if not any(paths.values()):
-        st.error("투수 최종성적 파일(1~4) 중 최소 1개 이상을 찾을 수 없습니다.")
-        return
-
-    dfs = {k: (read_xlsx(v) if v else None) for k,v in paths.items()}
-    masks = {k: (first_col_strip(df)==player_name if df is not None else None) for k,df in dfs.items()}
-
-    era   = value_from_any(dfs.values(), ["평균자책","평균자책점","era","평자"], masks.values())
-    w     = value_from_any(dfs.values(), ["승","승리","W"], masks.values())
-    l     = value_from_any(dfs.values(), ["패","패배","L"], masks.values())
-    sv    = value_from_any(dfs.values(), ["세이브","SV","Save"], masks.values())
-    hld   = value_from_any(dfs.values(), ["홀드","HLD","HD","Hold"], masks.values())
-    ip    = value_from_any(dfs.values(), ["이닝","IP"], masks.values())
-    qs    = value_from_any(dfs.values(), ["퀄리티스타트","QS"], masks.values())
-
-    top_cols = st.columns(6)
-    with top_cols[0]: st.metric("평균자책점", "N/A" if era is None else f"{era:.2f}")
-    with top_cols[1]: st.metric("승리", "N/A" if w   is None else f"{int(round(w))}")
-    with top_cols[2]: st.metric("패배", "N/A" if l   is None else f"{int(round(l))}")
-    with top_cols[3]: st.metric("세이브", "N/A" if sv is None else f"{int(round(sv))}")
-    with top_cols[4]: st.metric("홀드", "N/A" if hld is None else f"{int(round(hld))}")
-    with top_cols[5]: st.metric("이닝", "N/A" if ip  is None else f"{ip:.1f}")
-    if qs is not None:
-        st.metric("퀄리티스타트", f"{int(round(qs))}")
-
-    h_allowed = value_from_any(dfs.values(), ["피안타","피 h","h_allowed","피H"], masks.values())
-    hr_allowed= value_from_any(dfs.values(), ["피홈런","피 hr","hr_allowed","피HR"], masks.values())
-    bb       = value_from_any(dfs.values(), ["볼넷","bb","Base on Balls"], masks.values()) or 0
-    hbp      = value_from_any(dfs.values(), ["몸에맞는볼","사구","hbp"], masks.values()) or 0
-    so       = value_from_any(dfs.values(), ["삼진","so","k"], masks.values())
-
-    bb_sum = (bb or 0) + (hbp or 0)
-
-    counting_df = pd.DataFrame([
-        {"지표":"피안타","값": h_allowed or 0},
-        {"지표":"피홈런","값": hr_allowed or 0},
-        {"지표":"볼넷","값": bb_sum or 0},
-        {"지표":"삼진","값": so or 0},
-    ])
-    st.markdown("#### 카운팅 스탯 (투수)")
-    st.altair_chart(bar_with_labels(counting_df, "지표", "값", ",.0f", height=340), use_container_width=True)
-    st.caption("카운팅 스탯 (가로형)")
-    st.dataframe(horizontal_row_from_df(counting_df, is_rate=False), use_container_width=True, hide_index=True)
-
-    whip = value_from_any(dfs.values(), ["이닝당출루허용률","whip"], masks.values())
-    k9   = value_from_any(dfs.values(), ["9이닝당 삼진","9이닝당삼진","k/9","k9","so/9","삼진/9","탈삼진/9","탈삼진9"], masks.values())
-    bb9  = value_from_any(dfs.values(), ["9이닝당볼넷","9이닝당 볼넷","bb/9","bb9","볼넷/9"], masks.values())
-    kbb  = value_from_any(dfs.values(), ["삼진/볼넷","k/bb","kbb"], masks.values())
-    o_ops= value_from_any(dfs.values(), ["피ops","피 ops","o-ops","ops"], masks.values())
-    o_avg= value_from_any(dfs.values(), ["피안타율","피타율","oavg","avg","OAVG","BAA"], masks.values())
-
-    rate_df = pd.DataFrame([
-        {"지표":"이닝당출루허용률", "값": whip or 0},
-        {"지표":"9이닝당 삼진", "값": k9 or 0},
-        {"지표":"9이닝당 볼넷", "값": bb9 or 0},
-        {"지표":"삼진/볼넷", "값": kbb or 0},
-        {"지표":"피OPS", "값": o_ops or 0},
-        {"지표":"피안타율", "값": o_avg or 0},
-    ])
-    st.markdown("#### 비율 지표 (투수)")
-    st.altair_chart(bar_with_labels(rate_df, "지표", "값", ".3f", height=340), use_container_width=True)
-    st.caption("비율 지표 (가로형)")
-    st.dataframe(horizontal_row_from_df(rate_df, is_rate=True), use_container_width=True, hide_index=True)
-
-    # 월별 피안타율 꺾은선 + 가로형 표
-    month_defs = [
-        ("투수_3~4월.xlsx","3~4월"),
-        ("투수_5월.xlsx","5월"),
-        ("투수_6월.xlsx","6월"),
-        ("투수_7월.xlsx","7월"),
-        ("투수_8월.xlsx","8월"),
-        ("투수_9월이후.xlsx","9월이후"),
-    ]
-    rows=[]
-    for fname,label in month_defs:
-        p = next((x for x in PITCHER_PATHS if x.endswith(fname)), None)
-        if not p: continue
-        df = read_xlsx(p)
-        m  = first_col_strip(df)==player_name
-        if m.any():
-            oavg_col = get_col(df, ["피안타율","피타율","oavg","OAVG","BAA","AVG"])
-            val = parse_number(df.loc[m].iloc[0][oavg_col]) if oavg_col else None
-            rows.append({"월":label,"피안타율":val})
-
-    if rows:
-        trend_df = pd.DataFrame(rows)
-        order=[x[1] for x in month_defs]
-        trend_df["월"]=pd.Categorical(trend_df["월"],categories=order,ordered=True)
-        trend_df=trend_df.sort_values("월")
-
-        st.markdown("#### 월별 추이 — 피안타율")
-        st.altair_chart(
-            alt.Chart(trend_df).mark_line(point=True).encode(
-                x=alt.X("월:N", sort=order, axis=alt.Axis(labelAngle=0), title=None),
-                y=alt.Y("피안타율:Q", title=None, scale=alt.Scale(domain=[0,1])),
-                tooltip=[alt.Tooltip("월:N"), alt.Tooltip("피안타율:Q", format=".3f")],
-            ).properties(height=320).interactive()
-        , use_container_width=True)
-
-        table_row = {r["월"]: (0.000 if pd.isna(r["피안타율"]) else round(float(r["피안타율"]),3)) for _, r in trend_df.iterrows()}
-        st.caption("월별 피안타율 (가로형)")
-        st.dataframe(pd.DataFrame([table_row]), use_container_width=True, hide_index=True)
-    else:
-        st.info("월별 피안타율 데이터를 찾지 못했습니다.")
-
-# ==================== 투수 · 주자 있음/없음 ====================
-def visualize_pitcher_onbase(player_name: str, has_runner: bool):
-    """주자 있음/없음: 피안타율 메트릭(맨 위) → 막대 → 가로형 표"""
-    suffix = "투수_주자있음.xlsx" if has_runner else "투수_주자없음.xlsx"
-    path = next((p for p in PITCHER_PATHS if p.endswith(suffix)), None)
-    if not path:
-        st.error(f"{suffix} 파일을 찾을 수 없습니다.")
-        return
-
-    df = read_xlsx(path)
-    mask = first_col_strip(df) == player_name
-    if not mask.any():
-        st.info("선택한 선수를 해당 파일에서 찾지 못했습니다.")
-        return
-
-    h_allowed = value_from_any([df], ["피안타","피 H","H_ALLOWED","H"], [mask]) or 0
-    double    = value_from_any([df], ["2루타","2B","2루"], [mask]) or 0
-    triple    = value_from_any([df], ["3루타","3B","3루"], [mask]) or 0
-    hr        = value_from_any([df], ["피홈런","홈런","HR"], [mask]) or 0
-    bb        = value_from_any([df], ["볼넷","BB"], [mask]) or 0
-    hbp       = value_from_any([df], ["몸에맞는볼","사구","HBP"], [mask]) or 0
-    so        = value_from_any([df], ["삼진","SO","K"], [mask]) or 0
-    oavg      = value_from_any([df], ["피안타율","피타율","OAVG","BAA","AVG"], [mask])
-
-    title = "주자 있음" if has_runner else "주자 없음"
-    st.markdown(f"#### {player_name} — {title}")
-    st.metric(f"{title} — 피안타율", "N/A" if oavg is None else f"{oavg:.3f}")
-
-    bb_sum = (bb or 0) + (hbp or 0)
-    bar_df = pd.DataFrame([
-        {"지표":"피안타", "값": h_allowed},
-        {"지표":"2루타", "값": double},
-        {"지표":"3루타", "값": triple},
-        {"지표":"홈런",  "값": hr},
-        {"지표":"볼넷",  "값": bb_sum},
-        {"지표":"삼진",  "값": so},
-    ])
-    st.altair_chart(bar_with_labels(bar_df, "지표", "값", ",.0f", height=340), use_container_width=True)
-    st.caption(f"{title} — 카운팅 스탯 (가로형)")
-    st.dataframe(horizontal_row_from_df(bar_df, is_rate=False), use_container_width=True, hide_index=True)
-
-# ==================== 투수 · 주자 득점권 ====================
-def visualize_pitcher_risp(player_name: str):
-    """주자 득점권: 피안타율 메트릭(맨 위) → 막대 → 가로형 표"""
-    path = next((p for p in PITCHER_PATHS if p.endswith("투수_주자득점권.xlsx")), None)
-    if not path:
-        st.error("투수_주자득점권.xlsx 파일을 찾을 수 없습니다.")
-        return
-
-    df = read_xlsx(path)
-    mask = first_col_strip(df) == player_name
-    if not mask.any():
-        st.info("선택한 선수를 투수_주자득점권 파일에서 찾지 못했습니다.")
-        return
-
-    h_allowed = value_from_any([df], ["피안타","피 H","H_ALLOWED","H"], [mask]) or 0
-    double    = value_from_any([df], ["2루타","2B","2루"], [mask]) or 0
-    triple    = value_from_any([df], ["3루타","3B","3루"], [mask]) or 0
-    hr        = value_from_any([df], ["피홈런","홈런","HR"], [mask]) or 0
-    bb        = value_from_any([df], ["볼넷","BB"], [mask]) or 0
-    hbp       = value_from_any([df], ["몸에맞는볼","사구","HBP"], [mask]) or 0
-    so        = value_from_any([df], ["삼진","SO","K"], [mask]) or 0
-    oavg      = value_from_any([df], ["피안타율","피타율","OAVG","BAA","AVG"], [mask])
-
-    st.markdown(f"#### {player_name} — 주자 득점권")
-    st.metric("피안타율", "N/A" if oavg is None else f"{oavg:.3f}")
-
-    bb_sum = (bb or 0) + (hbp or 0)
-    bar_df = pd.DataFrame([
-        {"지표":"피안타", "값": h_allowed},
-        {"지표":"2루타", "값": double},
-        {"지표":"3루타", "값": triple},
-        {"지표":"홈런",  "값": hr},
-        {"지표":"볼넷",  "값": bb_sum},
-        {"지표":"삼진",  "값": so},
-    ])
-    st.altair_chart(bar_with_labels(bar_df, "지표", "값", ",.0f", height=340), use_container_width=True)
-    st.caption("주자 득점권 — 카운팅 스탯 (가로형)")
-    st.dataframe(horizontal_row_from_df(bar_df, is_rate=False), use_container_width=True, hide_index=True)
-
-# ==================== 투수 · 이닝별 ====================
-def visualize_pitcher_inning(player_name: str, inning_label: str):
-    mapping = {
-        "1~3이닝": "투수_1~3회.xlsx",
-        "4~6이닝": "투수_4~6회.xlsx",
-        "7이후":   "투수_7회이후.xlsx",
-    }
-    fname = mapping.get(inning_label)
-    path = next((p for p in PITCHER_PATHS if fname and p.endswith(fname)), None)
-    if not path:
-        st.error(f"{inning_label} 파일을 찾을 수 없습니다.")
-        return
-
-    df = read_xlsx(path)
-    mask = first_col_strip(df) == player_name
-    if not mask.any():
-        st.info("선택한 선수를 해당 파일에서 찾지 못했습니다.")
-        return
-
-    h_allowed = value_from_any([df], ["피안타","피 H","H_ALLOWED","H"], [mask]) or 0
-    double    = value_from_any([df], ["2루타","2B","2루"], [mask]) or 0
-    triple    = value_from_any([df], ["3루타","3B","3루"], [mask]) or 0
-    hr        = value_from_any([df], ["피홈런","홈런","HR"], [mask]) or 0
-    bb        = value_from_any([df], ["볼넷","BB"], [mask]) or 0
-    hbp       = value_from_any([df], ["몸에맞는볼","사구","HBP"], [mask]) or 0
-    so        = value_from_any([df], ["삼진","SO","K"], [mask]) or 0
-    oavg      = value_from_any([df], ["피안타율","피타율","OAVG","BAA","AVG"], [mask])
-
-    st.markdown(f"#### {player_name} — 이닝별 ({inning_label})")
-    st.metric(f"{inning_label} — 피안타율", "N/A" if oavg is None else f"{oavg:.3f}")
-
-    bb_sum = (bb or 0) + (hbp or 0)
-    bar_df = pd.DataFrame([
-        {"지표":"피안타", "값": h_allowed},
-        {"지표":"2루타", "값": double},
-        {"지표":"3루타", "값": triple},
-        {"지표":"홈런",  "값": hr},
-        {"지표":"볼넷",  "값": bb_sum},
-        {"지표":"삼진",  "값": so},
-    ])
-    st.altair_chart(bar_with_labels(bar_df, "지표", "값", ",.0f", height=340), use_container_width=True)
-    st.caption(f"{inning_label} — 카운팅 스탯 (가로형)")
-    st.dataframe(horizontal_row_from_df(bar_df, is_rate=False), use_container_width=True, hide_index=True)
-
-# ==================== 투수 · 월별 ====================
-def visualize_pitcher_month(player_name: str, month_label: str):
-    mapping = {
-        "3~4월": "투수_3~4월.xlsx",
-        "5월":   "투수_5월.xlsx",
-        "6월":   "투수_6월.xlsx",
-        "7월":   "투수_7월.xlsx",
-        "8월":   "투수_8월.xlsx",
-        "9이후": "투수_9월이후.xlsx",
-    }
-    fname = mapping.get(month_label)
-    path = next((p for p in PITCHER_PATHS if fname and p.endswith(fname)), None)
-    if not path:
-        st.error(f"{month_label} 파일을 찾을 수 없습니다.")
-        return
+@st.cache_data(show_spinner=False, max_entries=VIEW_CACHE_ENTRIES)
+def build_part(position, player_name, detail, sub_selection, part, signature):
+    """
+    (포지션, 선수, 세부사항, 월/이닝 선택, 섹션) 단위로 뷰 모델(섹션 리스트)을 계산.
+    - signature(워크북 수정시각/크기)는 캐시 키 용도 — 파일이 바뀌면 자동 무효화
+    """
+    paths, held = player_paths(position, player_name)
+    return compute_part(position, paths, player_name, detail, sub_selection, part, held)
+
+# ==================== 뷰 렌더링 ====================
+def render_section(sec):
+    kind = sec["kind"]
+    if kind == "error":
+        st.error(sec["text"])
+    elif kind == "warning":
+        st.warning(sec["text"])
+    elif kind == "info":
+        st.info(sec["text"])
+    elif kind == "heading":
+        st.markdown(sec["text"])
+    elif kind == "metrics":
+        items = sec["items"]
+        if len(items) == 1:
+            st.metric(*items[0])
+        else:
+            for col, item in zip(st.columns(len(items)), items):
+                with col: st.metric(*item)
+    elif kind == "columns":
+        for col, sub in zip(st.columns(len(sec["sections"])), sec["sections"]):
+            with col: render_section(sub)
+    elif kind == "bar":
+        if sec.get("title"):
+            st.markdown(f"#### {sec['title']}")
+        st.altair_chart(section_bar_chart(sec), use_container_width=True)
+        st.caption(sec["caption"])
+        st.dataframe(horizontal_row_from_df(sec["df"], is_rate=sec["is_rate"]), use_container_width=True, hide_index=True)
+    elif kind == "trend":
+        st.markdown(f"#### {sec['title']}")
+        st.altair_chart(section_trend_chart(sec), use_container_width=True)
+        if sec.get("caption"):
+            st.caption(sec["caption"])
+            st.dataframe(trend_table(sec), use_container_width=True, hide_index=True)
+
+def render_view(sections):
+    for sec in sections:
+        render_section(sec)
+
+RENDER_WORKERS = 4
+
+@st.cache_resource
+def render_pool():
+    """섹션 계산용 스레드 풀 (세션 간 공유)"""
+    return ThreadPoolExecutor(max_workers=RENDER_WORKERS, thread_name_prefix="view-part")
+
+def render_progressive(position, player_name, detail, sub_selection, signature):
+    """
+    섹션마다 자리(placeholder)를 먼저 깔고, 스레드 풀에서 계산이 끝나는 순서대로 채움.
+    - 스레드에서는 데이터 계산(build_part)만, st 호출은 메인 스크립트 스레드에서만
+    """
+    parts = view_parts(position, detail)
+    slots = {}
+    for part in parts:
+        slots[part] = st.empty()
+        slots[part].caption("불러오는 중…")
 
-    df = read_xlsx(path)
-    mask = first_col_strip(df) == player_name
-    if not mask.any():
-        st.info("선택한 선수를 해당 파일에서 찾지 못했습니다.")
-        return
+    ctx = get_script_run_ctx()
+    def run(part):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return build_part(position, player_name, detail, sub_selection, part, signature)
 
-    h_allowed = value_from_any([df], ["피안타","피 H","H_ALLOWED","H"], [mask]) or 0
-    double    = value_from_any([df], ["2루타","2B","2루"], [mask]) or 0
-    triple    = value_from_any([df], ["3루타","3B","3루"], [mask]) or 0
-    hr        = value_from_any([df], ["피홈런","홈런","HR"], [mask]) or 0
-    bb        = value_from_any([df], ["볼넷","BB"], [mask]) or 0
-    hbp       = value_from_any([df], ["몸에맞는볼","사구","HBP"], [mask]) or 0
-    so        = value_from_any([df], ["삼진","SO","K"], [mask]) or 0
-    oavg      = value_from_any([df], ["피안타율","피타율","OAVG","BAA","AVG"], [mask])
+    futures = {render_pool().submit(run, part): part for part in parts}
+    for fut in as_completed(futures):
+        with slots[futures[fut]].container():
+            render_view(fut.result())
 
-    st.markdown(f"#### {player_name} — 월별 ({month_label})")
-    st.metric(f"{month_label} — 피안타율", "N/A" if oavg is None else f"{oavg:.3f}")
+# ==================== 유사 선수 ====================
+SIMILAR_K = 5
 
-    bb_sum = (bb or 0) + (hbp or 0)
-    bar_df = pd.DataFrame([
-        {"지표":"피안타", "값": h_allowed},
-        {"지표":"2루타", "값": double},
-        {"지표":"3루타", "값": triple},
-        {"지표":"홈런",  "값": hr},
-        {"지표":"볼넷",  "값": bb_sum},
-        {"지표":"삼진",  "값": so},
-    ])
-    st.altair_chart(bar_with_labels(bar_df, "지표", "값", ",.0f", height=340), use_container_width=True)
-    st.caption(f"{month_label} — 카운팅 스탯 (가로형)")
-    st.dataframe(horizontal_row_from_df(bar_df, is_rate=False), use_container_width=True, hide_index=True)
+@st.cache_data(show_spinner=False)
+def similarity_index(position, file_paths, excluded, signature):
+    """분할 비율 지표 표준화 행렬 (excluded: 격리 행 ((경로, 선수들), ...), signature는 캐시 키 용도)"""
+    return split_feature_matrix(position, file_paths, dict(excluded))
+
+def render_similar_players(position, player_name):
+    paths, quarantined = (PITCHER_PATHS, P_QUARANTINED) if position == "투수" else (HITTER_PATHS, H_QUARANTINED)
+    excluded = tuple(sorted((p, tuple(sorted(v))) for p, v in quarantined.items())) if QUARANTINE_BAD_SPLITS else ()
+    raw, z = similarity_index(position, tuple(paths), excluded, files_signature(paths))
+    rate = "피안타율" if position == "투수" else "타율"
+    with st.expander(f"유사 선수 — 분할별 {rate} 프로필 기준"):
+        similar = nearest_players(raw, z, player_name, k=SIMILAR_K)
+        if similar.empty:
+            st.info(
+                "분할 표본이 부족해 유사 선수를 계산하지 않습니다. "
+                f"({SIMILARITY_MIN_AB}타수 이상인 분할이 {SIMILARITY_MIN_COVERAGE:.0%} 이상 필요)"
+            )
+            return
+        st.caption(f"{player_name} — 분할별 리그 내 백분위 ({SIMILARITY_MIN_AB}타수 미만 분할은 제외)")
+        st.dataframe(pd.DataFrame([feature_percentiles(raw, player_name).round(0)]), use_container_width=True, hide_index=True)
+        st.caption(f"가장 비슷한 {len(similar)}명 (표준화 유클리드 거리, 작을수록 유사)")
+        st.dataframe(similar.round(3), use_container_width=True, hide_index=True)
 
 # ===================== 호출 분기 =====================
-if position == "타자" and selected_player:
-    if detail == "세부사항 없음":
-        visualize_batter_overall(selected_player)
-        visualize_batter_monthly_avg(selected_player)  # 꺾은선 추이
-    elif detail == "주자 있음":
-        visualize_batter_onbase(selected_player, has_runner=True)
-    elif detail == "주자 없음":
-        visualize_batter_onbase(selected_player, has_runner=False)
-    elif detail == "주자 득점권":
-        visualize_batter_risp(selected_player)
-    elif detail == "이닝별":
-        visualize_batter_inning(selected_player, inning_selection)
-    elif detail == "월별":
-        visualize_batter_month(selected_player, month_selection)
-
-elif position == "투수" and selected_player:
-    if detail == "세부사항 없음":
-        visualize_pitcher_overall(selected_player)
-    elif detail == "주자 있음":
-        visualize_pitcher_onbase(selected_player, has_runner=True)
-    elif detail == "주자 없음":
-        visualize_pitcher_onbase(selected_player, has_runner=False)
-    elif detail == "주자 득점권":
-        visualize_pitcher_risp(selected_player)
-    elif detail == "이닝별":
-        visualize_pitcher_inning(selected_player, inning_selection)
-    elif detail == "월별":
-        visualize_pitcher_month(selected_player, month_selection)
-
+if selected_player:
+    sub_selection = inning_selection if detail == "이닝별" else month_selection if detail == "월별" else None
+    paths, _ = player_paths(position, selected_player)
+    render_progressive(position, selected_player, detail, sub_selection, files_signature(paths))
+    render_similar_players(position, selected_player)
 else:
     st.info("상단 검색창에 일부 이름을 입력해 선수를 선택해 주세요. (포지션에 따라 검색 대상이 달라집니다.)")
@@ -0,0 +1,578 @@
+"""
+뷰 모델: 선수 · 세부사항별 화면을 섹션 dict 리스트로 계산하고 차트를 만든다.
+
+Streamlit 없이 import 가능 — streamlit_app.py(화면)와 prerender.py(정적 리포트)가 공유.
+섹션 빌더는 모두 첫 인자로 해당 포지션의 파일 경로 목록(paths)을 받는다.
+"""
+import os
+
+import pandas as pd
+import altair as alt
+
+from stat_store import find_path, first_col_strip, get_col, parse_number, value_from_any, read_xlsx
+
+DETAILS = ["주자 득점권", "세부사항 없음", "주자 있음", "주자 없음", "이닝별", "월별"]
+MONTH_OPTIONS = ["3~4월", "5월", "6월", "7월", "8월", "9이후"]
+INNING_OPTIONS = ["1~3이닝", "4~6이닝", "7이후"]
+
+# ============== 공통: 차트 / 표 유틸 ==============
+def bar_with_labels(data, x_field, y_field, y_fmt, height=350):
+    base = alt.Chart(data).encode(
+        x=alt.X(f"{x_field}:N", sort=None, title=None, axis=alt.Axis(labelAngle=0)),
+        y=alt.Y(f"{y_field}:Q", title=None),
+        tooltip=[x_field, alt.Tooltip(f"{y_field}:Q", format=y_fmt)],
+    )
+    bars = base.mark_bar()
+    labels = base.mark_text(dy=-5).encode(text=alt.Text(f"{y_field}:Q", format=y_fmt))
+    return (bars + labels).properties(height=height).interactive()
+
+def horizontal_row_from_df(df: pd.DataFrame, k_col="지표", v_col="값", is_rate=False):
+    """한 줄 가로 테이블 생성(카운팅: 정수, 비율: 소수3)"""
+    row = {}
+    for _, r in df.iterrows():
+        if is_rate:
+            val = 0.000 if pd.isna(r[v_col]) else round(float(r[v_col]), 3)
+        else:
+            val = 0 if pd.isna(r[v_col]) else int(round(r[v_col]))
+        row[str(r[k_col])] = val
+    return pd.DataFrame([row])
+
+def section_bar_chart(sec):
+    """bar 섹션 → 라벨 달린 막대 차트"""
+    chart = bar_with_labels(sec["df"], "지표", "값", sec["fmt"], height=sec.get("height", 340))
+    if sec.get("domain"):
+        chart = chart.encode(y=alt.Y("값:Q", title=None, scale=alt.Scale(domain=sec["domain"])))
+    return chart
+
+def section_trend_chart(sec):
+    """trend 섹션 → 월별 꺾은선 차트"""
+    y, order = sec["y"], sec["order"]
+    return alt.Chart(sec["df"]).mark_line(point=True).encode(
+        x=alt.X("월:N", sort=order, axis=alt.Axis(labelAngle=0), title=None),
+        y=alt.Y(f"{y}:Q", title=None, scale=alt.Scale(domain=[0,1])),
+        tooltip=[alt.Tooltip("월:N"), alt.Tooltip(f"{y}:Q", format=".3f")],
+    ).properties(height=320).interactive()
+
+def trend_table(sec):
+    """trend 섹션 → 월별 값 한 줄 가로 테이블"""
+    y = sec["y"]
+    row = {r["월"]: (0.000 if pd.isna(r[y]) else round(float(r[y]),3)) for _, r in sec["df"].iterrows()}
+    return pd.DataFrame([row])
+
+# ==================== 뷰 모델 공통 ====================
+# 뷰는 섹션 dict 리스트로 계산한 뒤 render_view에서 그린다.
+#   {"kind":"error"|"info"|"warning", "text":...}   (warning: 정합성 격리 안내)
+#   {"kind":"heading", "text":...}
+#   {"kind":"metrics", "items":[(라벨, 표시값), ...]}
+#   {"kind":"bar", "df":..., "fmt":..., "is_rate":..., "title":..., "caption":..., "domain":...}
+#   {"kind":"columns", "sections":[섹션, ...]}
+#   {"kind":"trend", "df":..., "y":..., "order":[...], "title":..., "caption":...}
+def fmt_rate(x):
+    return "N/A" if x is None else f"{x:.3f}"
+
+def fmt_int(x):
+    return "N/A" if x is None else f"{int(round(x))}"
+
+def trend_section(paths, month_defs, player_name, y_label, candidates, empty_msg, caption=None):
+    """월별 파일들에서 선수의 비율 지표를 모아 꺾은선 섹션 생성"""
+    rows = []
+    for fname, label in month_defs:
+        p = find_path(paths, fname)
+        if not p: continue
+        df = read_xlsx(p)
+        m = first_col_strip(df) == player_name
+        if m.any():
+            c = get_col(df, candidates)
+            val = parse_number(df.loc[m].iloc[0][c]) if c else None
+            rows.append({"월": label, y_label: val})
+    if not rows:
+        return {"kind": "info", "text": empty_msg}
+    trend_df = pd.DataFrame(rows)
+    order = [x[1] for x in month_defs]
+    trend_df["월"] = pd.Categorical(trend_df["월"], categories=order, ordered=True)
+    trend_df = trend_df.sort_values("월")
+    return {"kind": "trend", "df": trend_df, "y": y_label, "order": order,
+            "title": f"월별 추이 — {y_label}", "caption": caption}
+
+def split_view(path, missing_msg, notfound_msg, player_name, bar_builder):
+    """단일 분할 파일 뷰의 공통 앞부분: 파일/선수 확인 후 bar_builder(df, mask) 결과 반환"""
+    if not path:
+        return [{"kind": "error", "text": missing_msg}]
+    df = read_xlsx(path)
+    mask = first_col_strip(df) == player_name
+    if not mask.any():
+        return [{"kind": "info", "text": notfound_msg}]
+    return bar_builder(df, mask)
+
+# ==================== 타자 · 세부사항 없음 + 월별 추이(타율) ====================
+BATTER_MONTH_DEFS = [
+    ("타자_3~4월.xlsx","3~4월"),("타자_5월.xlsx","5월"),("타자_6월.xlsx","6월"),
+    ("타자_7월.xlsx","7월"),("타자_8월.xlsx","8월"),("타자_9월이후.xlsx","9월이후"),
+]
+
+def batter_overall_files(paths):
+    return find_path(paths, "타자_최종성적1.xlsx"), find_path(paths, "타자_최종성적2.xlsx")
+
+def batter_overall_metrics_part(paths, player_name: str):
+    """타율 메트릭 — 최종성적1 한 파일만 읽음 (선수가 없을 때만 2까지 확인)"""
+    f1, f2 = batter_overall_files(paths)
+    if not f1 or not f2:
+        return [{"kind": "error", "text": "타자 최종성적 파일(1,2)을 찾을 수 없습니다."}]
+
+    df1 = read_xlsx(f1)
+    m1 = first_col_strip(df1) == player_name
+    if not m1.any():
+        df2 = read_xlsx(f2)
+        if not (first_col_strip(df2) == player_name).any():
+            return [{"kind": "info", "text": "선택한 선수를 최종성적 파일에서 찾지 못했습니다."}]
+
+    avg  = value_from_any([df1],[ "타율"],[m1])
+    return [{"kind": "metrics", "items": [("타율", fmt_rate(avg))]}]
+
+def batter_overall_charts_part(paths, player_name: str):
+    """카운팅 / 비율 막대 (2열). 파일·선수 누락 안내는 metrics 쪽에서 표시"""
+    f1, f2 = batter_overall_files(paths)
+    if not f1 or not f2:
+        return []
+
+    df1 = read_xlsx(f1); df2 = read_xlsx(f2)
+    m1 = first_col_strip(df1) == player_name
+    m2 = first_col_strip(df2) == player_name
+    if not m1.any() and not m2.any():
+        return []
+
+    ab   = value_from_any([df1],[ "타수"],[m1])
+    r    = value_from_any([df1],[ "득점"],[m1])
+    h    = value_from_any([df1],[ "안타"],[m1])
+    hr   = value_from_any([df1],[ "홈런"],[m1])
+    rbi  = value_from_any([df1],[ "타점"],[m1])
+
+    bb   = value_from_any([df2],[ "볼넷"],[m2]) or 0
+    ibb  = value_from_any([df2],[ "고의4구","고의 사구","고의4"],[m2]) or 0
+    hbp  = value_from_any([df2],[ "몸에맞는볼","사구"],[m2]) or 0
+    so   = value_from_any([df2],[ "삼진"],[m2])
+    gidp = value_from_any([df2],[ "병살","병살타"],[m2])
+    slg  = value_from_any([df2],[ "장타율"],[m2])
+    obp  = value_from_any([df2],[ "출루율"],[m2])
+    ops  = value_from_any([df2],[ "ops","OPS","OPS(출+장)","ops(출+장)"],[m2])
+    risp = value_from_any([df2],[ "득점권","득점권 타율","득점권타율"],[m2])
+
+    bb_sum = (bb or 0) + (ibb or 0) + (hbp or 0)
+
+    counting_df = pd.DataFrame([{"지표": k, "값": v if v is not None else 0} for k, v in {
+        "타수":ab,"득점":r,"안타":h,"홈런":hr,"타점":rbi,"볼넷":bb_sum,"삼진":so,"병살타":gidp
+    }.items()])
+    rate_df = pd.DataFrame([{"지표": k, "값": v if v is not None else 0} for k, v in {
+        "출루율":obp,"장타율":slg,"OPS(출+장)":ops,"득점권 타율":risp
+    }.items()])
+
+    return [
+        {"kind": "columns", "sections": [
+            {"kind": "bar", "df": counting_df, "fmt": ",.0f", "is_rate": False, "height": 350,
+             "title": f"{player_name} — 카운팅 스탯", "caption": "카운팅 스탯 (가로형)"},
+            {"kind": "bar", "df": rate_df, "fmt": ".3f", "is_rate": True, "height": 350, "domain": [0, 2],
+             "title": f"{player_name} — 비율/OPS", "caption": "비율/OPS (가로형)"},
+        ]},
+    ]
+
+def batter_monthly_avg_part(paths, player_name: str):
+    return [trend_section(paths, BATTER_MONTH_DEFS, player_name, "타율", ["타율"],
+                          "월별 타율 데이터를 찾지 못했습니다.")]
+
+# ==================== 타자 · 주자 있음/없음/득점권 · 이닝별 · 월별 ====================
+def batter_split_bar(heading, metric_label, caption, avg_candidates=("타율","AVG")):
+    """타자 분할 파일: 타율 메트릭(맨 위) → 막대 → 가로형 표"""
+    def build(df, mask):
+        ab  = value_from_any([df], ["타수"], [mask]) or 0
+        h   = value_from_any([df], ["안타"], [mask]) or 0
+        d2  = value_from_any([df], ["2루타","2B","2루"], [mask]) or 0
+        d3  = value_from_any([df], ["3루타","3B","3루"], [mask]) or 0
+        hr  = value_from_any([df], ["홈런","HR"], [mask]) or 0
+        rbi = value_from_any([df], ["타점"], [mask]) or 0
+        bb  = value_from_any([df], ["볼넷","BB"], [mask]) or 0
+        hbp = value_from_any([df], ["몸에맞는볼","사구","HBP"], [mask]) or 0
+        so  = value_from_any([df], ["삼진","SO","K"], [mask]) or 0
+        gd  = value_from_any([df], ["병살","병살타","GIDP"], [mask]) or 0
+        avg = value_from_any([df], list(avg_candidates), [mask])
+
+        bb_sum = (bb or 0) + (hbp or 0)
+
+        bar_df = pd.DataFrame([
+            {"지표":"타수","값":ab},
+            {"지표":"안타","값":h},
+            {"지표":"2루타","값":d2},
+            {"지표":"3루타","값":d3},
+            {"지표":"홈런","값":hr},
+            {"지표":"타점","값":rbi},
+            {"지표":"볼넷","값":bb_sum},
+            {"지표":"삼진","값":so},
+            {"지표":"병살타","값":gd},
+        ])
+        return [
+            {"kind": "heading", "text": heading},
+            {"kind": "metrics", "items": [(metric_label, fmt_rate(avg))]},
+            {"kind": "bar", "df": bar_df, "fmt": ",.0f", "is_rate": False, "caption": caption},
+        ]
+    return build
+
+def batter_onbase_sections(paths, player_name: str, has_runner: bool):
+    suffix = "타자_주자있음.xlsx" if has_runner else "타자_주자없음.xlsx"
+    title = "주자 있음" if has_runner else "주자 없음"
+    return split_view(
+        find_path(paths, suffix), f"{suffix} 파일을 찾을 수 없습니다.",
+        "선택한 선수를 해당 파일에서 찾지 못했습니다.", player_name,
+        batter_split_bar(f"#### {player_name} — {title}", f"{title} — 타율", f"{title} — 카운팅 스탯 (가로형)"),
+    )
+
+def batter_risp_sections(paths, player_name: str):
+    return split_view(
+        find_path(paths, "타자_주자득점권.xlsx"), "타자_주자득점권.xlsx 파일을 찾을 수 없습니다.",
+        "선택한 선수를 타자_주자득점권 파일에서 찾지 못했습니다.", player_name,
+        batter_split_bar(f"#### {player_name} — 주자 득점권", "득점권 타율", "주자 득점권 — 카운팅 스탯 (가로형)",
+                         avg_candidates=("득점권","득점권 타율","득점권타율","타율","AVG")),
+    )
+
+BATTER_INNING_FILES = {
+    "1~3이닝": "타자_1~3회.xlsx",
+    "4~6이닝": "타자_4~6회.xlsx",
+    "7이후":   "타자_7회이후.xlsx",
+}
+
+BATTER_MONTH_FILES = {
+    "3~4월": "타자_3~4월.xlsx",
+    "5월":   "타자_5월.xlsx",
+    "6월":   "타자_6월.xlsx",
+    "7월":   "타자_7월.xlsx",
+    "8월":   "타자_8월.xlsx",
+    "9이후": "타자_9월이후.xlsx",
+}
+
+def batter_inning_sections(paths, player_name: str, inning_label: str):
+    fname = BATTER_INNING_FILES.get(inning_label)
+    return split_view(
+        find_path(paths, fname), f"{inning_label} 파일을 찾을 수 없습니다.",
+        "선택한 선수를 해당 파일에서 찾지 못했습니다.", player_name,
+        batter_split_bar(f"#### {player_name} — 이닝별 ({inning_label})", f"{inning_label} — 타율",
+                         f"{inning_label} — 카운팅 스탯 (가로형)"),
+    )
+
+def batter_month_sections(paths, player_name: str, month_label: str):
+    fname = BATTER_MONTH_FILES.get(month_label)
+    return split_view(
+        find_path(paths, fname), f"{month_label} 파일을 찾을 수 없습니다.",
+        "선택한 선수를 해당 파일에서 찾지 못했습니다.", player_name,
+        batter_split_bar(f"#### {player_name} — 월별 ({month_label})", f"{month_label} — 타율",
+                         f"{month_label} — 카운팅 스탯 (가로형)"),
+    )
+
+# ==================== 투수 · 세부사항 없음 + 월별 추이(피안타율) ====================
+PITCHER_MONTH_DEFS = [
+    ("투수_3~4월.xlsx","3~4월"),
+    ("투수_5월.xlsx","5월"),
+    ("투수_6월.xlsx","6월"),
+    ("투수_7월.xlsx","7월"),
+    ("투수_8월.xlsx","8월"),
+    ("투수_9월이후.xlsx","9월이후"),
+]
+
+PITCHER_TOTAL_FILES = [
+    "투수_최종성적1.xlsx",
+    "투수_최종성적2.xlsx",
+    "투수_최종성적3.xlsx",
+    "투수_최종성적4.xlsx",
+]
+
+def pitcher_total_rows(paths, player_name: str):
+    """
+    최종성적 1~4의 (df, mask)를 순서대로 내는 지연 제너레이터 함수 반환.
+    - 파일은 처음 필요할 때 한 번만 읽음 → 앞 파일에서 값이 나오면 뒤 파일은 안 읽음
+    - 파일이 하나도 없으면 None
+    """
+    totals = [find_path(paths, f) for f in PITCHER_TOTAL_FILES]
+    if not any(totals):
+        return None
+    loaded = {}
+    def rows():
+        for p in totals:
+            if not p: continue
+            if p not in loaded:
+                df = read_xlsx(p)
+                loaded[p] = (df, first_col_strip(df) == player_name)
+            yield loaded[p]
+    return rows
+
+def value_from_rows(rows, candidates):
+    """value_from_any의 지연 버전(rows: pitcher_total_rows 결과)"""
+    for df, m in rows():
+        if not m.any():
+            continue
+        col = get_col(df, candidates)
+        if col:
+            try:
+                return parse_number(df.loc[m].iloc[0][col])
+            except Exception:
+                continue
+    return None
+
+def pitcher_overall_metrics_part(paths, player_name: str):
+    rows = pitcher_total_rows(paths, player_name)
+    if rows is None:
+        return [{"kind": "error", "text": "투수 최종성적 파일(1~4) 중 최소 1개 이상을 찾을 수 없습니다."}]
+
+    era   = value_from_rows(rows, ["평균자책","평균자책점","era","평자"])
+    w     = value_from_rows(rows, ["승","승리","W"])
+    l     = value_from_rows(rows, ["패","패배","L"])
+    sv    = value_from_rows(rows, ["세이브","SV","Save"])
+    hld   = value_from_rows(rows, ["홀드","HLD","HD","Hold"])
+    ip    = value_from_rows(rows, ["이닝","IP"])
+    qs    = value_from_rows(rows, ["퀄리티스타트","QS"])
+
+    sections = [{"kind": "metrics", "items": [
+        ("평균자책점", "N/A" if era is None else f"{era:.2f}"),
+        ("승리", fmt_int(w)),
+        ("패배", fmt_int(l)),
+        ("세이브", fmt_int(sv)),
+        ("홀드", fmt_int(hld)),
+        ("이닝", "N/A" if ip is None else f"{ip:.1f}"),
+    ]}]
+    if qs is not None:
+        sections.append({"kind": "metrics", "items": [("퀄리티스타트", fmt_int(qs))]})
+    return sections
+
+def pitcher_overall_counting_part(paths, player_name: str):
+    rows = pitcher_total_rows(paths, player_name)
+    if rows is None:
+        return []
+
+    h_allowed = value_from_rows(rows, ["피안타","피 h","h_allowed","피H"])
+    hr_allowed= value_from_rows(rows, ["피홈런","피 hr","hr_allowed","피HR"])
+    bb       = value_from_rows(rows, ["볼넷","bb","Base on Balls"]) or 0
+    hbp      = value_from_rows(rows, ["몸에맞는볼","사구","hbp"]) or 0
+    so       = value_from_rows(rows, ["삼진","so","k"])
+
+    bb_sum = (bb or 0) + (hbp or 0)
+
+    counting_df = pd.DataFrame([
+        {"지표":"피안타","값": h_allowed or 0},
+        {"지표":"피홈런","값": hr_allowed or 0},
+        {"지표":"볼넷","값": bb_sum or 0},
+        {"지표":"삼진","값": so or 0},
+    ])
+    return [{"kind": "bar", "df": counting_df, "fmt": ",.0f", "is_rate": False,
+             "title": "카운팅 스탯 (투수)", "caption": "카운팅 스탯 (가로형)"}]
+
+def pitcher_overall_rate_part(paths, player_name: str):
+    rows = pitcher_total_rows(paths, player_name)
+    if rows is None:
+        return []
+
+    whip = value_from_rows(rows, ["이닝당출루허용률","whip"])
+    k9   = value_from_rows(rows, ["9이닝당 삼진","9이닝당삼진","k/9","k9","so/9","삼진/9","탈삼진/9","탈삼진9"])
+    bb9  = value_from_rows(rows, ["9이닝당볼넷","9이닝당 볼넷","bb/9","bb9","볼넷/9"])
+    kbb  = value_from_rows(rows, ["삼진/볼넷","k/bb","kbb"])
+    o_ops= value_from_rows(rows, ["피ops","피 ops","o-ops","ops"])
+    o_avg= value_from_rows(rows, ["피안타율","피타율","oavg","avg","OAVG","BAA"])
+
+    rate_df = pd.DataFrame([
+        {"지표":"이닝당출루허용률", "값": whip or 0},
+        {"지표":"9이닝당 삼진", "값": k9 or 0},
+        {"지표":"9이닝당 볼넷", "값": bb9 or 0},
+        {"지표":"삼진/볼넷", "값": kbb or 0},
+        {"지표":"피OPS", "값": o_ops or 0},
+        {"지표":"피안타율", "값": o_avg or 0},
+    ])
+    return [{"kind": "bar", "df": rate_df, "fmt": ".3f", "is_rate": True,
+             "title": "비율 지표 (투수)", "caption": "비율 지표 (가로형)"}]
+
+def pitcher_monthly_oavg_part(paths, player_name: str):
+    if not any(find_path(paths, f) for f in PITCHER_TOTAL_FILES):
+        return []
+    return [trend_section(paths, PITCHER_MONTH_DEFS, player_name, "피안타율",
+                          ["피안타율","피타율","oavg","OAVG","BAA","AVG"],
+                          "월별 피안타율 데이터를 찾지 못했습니다.", caption="월별 피안타율 (가로형)")]
+
+# ==================== 투수 · 주자 있음/없음/득점권 · 이닝별 · 월별 ====================
+def pitcher_split_bar(heading, metric_label, caption):
+    """투수 분할 파일: 피안타율 메트릭(맨 위) → 막대 → 가로형 표"""
+    def build(df, mask):
+        h_allowed = value_from_any([df], ["피안타","피 H","H_ALLOWED","H"], [mask]) or 0
+        double    = value_from_any([df], ["2루타","2B","2루"], [mask]) or 0
+        triple    = value_from_any([df], ["3루타","3B","3루"], [mask]) or 0
+        hr        = value_from_any([df], ["피홈런","홈런","HR"], [mask]) or 0
+        bb        = value_from_any([df], ["볼넷","BB"], [mask]) or 0
+        hbp       = value_from_any([df], ["몸에맞는볼","사구","HBP"], [mask]) or 0
+        so        = value_from_any([df], ["삼진","SO","K"], [mask]) or 0
+        oavg      = value_from_any([df], ["피안타율","피타율","OAVG","BAA","AVG"], [mask])
+
+        bb_sum = (bb or 0) + (hbp or 0)
+        bar_df = pd.DataFrame([
+            {"지표":"피안타", "값": h_allowed},
+            {"지표":"2루타", "값": double},
+            {"지표":"3루타", "값": triple},
+            {"지표":"홈런",  "값": hr},
+            {"지표":"볼넷",  "값": bb_sum},
+            {"지표":"삼진",  "값": so},
+        ])
+        return [
+            {"kind": "heading", "text": heading},
+            {"kind": "metrics", "items": [(metric_label, fmt_rate(oavg))]},
+            {"kind": "bar", "df": bar_df, "fmt": ",.0f", "is_rate": False, "caption": caption},
+        ]
+    return build
+
+def pitcher_onbase_sections(paths, player_name: str, has_runner: bool):
+    suffix = "투수_주자있음.xlsx" if has_runner else "투수_주자없음.xlsx"
+    title = "주자 있음" if has_runner else "주자 없음"
+    return split_view(
+        find_path(paths, suffix), f"{suffix} 파일을 찾을 수 없습니다.",
+        "선택한 선수를 해당 파일에서 찾지 못했습니다.", player_name,
+        pitcher_split_bar(f"#### {player_name} — {title}", f"{title} — 피안타율", f"{title} — 카운팅 스탯 (가로형)"),
+    )
+
+def pitcher_risp_sections(paths, player_name: str):
+    return split_view(
+        find_path(paths, "투수_주자득점권.xlsx"), "투수_주자득점권.xlsx 파일을 찾을 수 없습니다.",
+        "선택한 선수를 투수_주자득점권 파일에서 찾지 못했습니다.", player_name,
+        pitcher_split_bar(f"#### {player_name} — 주자 득점권", "피안타율", "주자 득점권 — 카운팅 스탯 (가로형)"),
+    )
+
+PITCHER_INNING_FILES = {
+    "1~3이닝": "투수_1~3회.xlsx",
+    "4~6이닝": "투수_4~6회.xlsx",
+    "7이후":   "투수_7회이후.xlsx",
+}
+
+PITCHER_MONTH_FILES = {
+    "3~4월": "투수_3~4월.xlsx",
+    "5월":   "투수_5월.xlsx",
+    "6월":   "투수_6월.xlsx",
+    "7월":   "투수_7월.xlsx",
+    "8월":   "투수_8월.xlsx",
+    "9이후": "투수_9월이후.xlsx",
+}
+
+def pitcher_inning_sections(paths, player_name: str, inning_label: str):
+    fname = PITCHER_INNING_FILES.get(inning_label)
+    return split_view(
+        find_path(paths, fname), f"{inning_label} 파일을 찾을 수 없습니다.",
+        "선택한 선수를 해당 파일에서 찾지 못했습니다.", player_name,
+        pitcher_split_bar(f"#### {player_name} — 이닝별 ({inning_label})", f"{inning_label} — 피안타율",
+                          f"{inning_label} — 카운팅 스탯 (가로형)"),
+    )
+
+def pitcher_month_sections(paths, player_name: str, month_label: str):
+    fname = PITCHER_MONTH_FILES.get(month_label)
+    return split_view(
+        find_path(paths, fname), f"{month_label} 파일을 찾을 수 없습니다.",
+        "선택한 선수를 해당 파일에서 찾지 못했습니다.", player_name,
+        pitcher_split_bar(f"#### {player_name} — 월별 ({month_label})", f"{month_label} — 피안타율",
+                          f"{month_label} — 카운팅 스탯 (가로형)"),
+    )
+
+# ==================== 뷰 계산 ====================
+# '세부사항 없음' 뷰는 서로 독립인 섹션(part)으로 나눠 따로 계산/표시
+OVERALL_PARTS = {
+    "타자": {
+        "metrics": batter_overall_metrics_part,
+        "charts":  batter_overall_charts_part,
+        "trend":   batter_monthly_avg_part,
+    },
+    "투수": {
+        "metrics":  pitcher_overall_metrics_part,
+        "counting": pitcher_overall_counting_part,
+        "rate":     pitcher_overall_rate_part,
+        "trend":    pitcher_monthly_oavg_part,
+    },
+}
+
+def view_parts(position, detail):
+    """뷰를 구성하는 섹션 이름 목록(표시 순서)"""
+    if detail == "세부사항 없음":
+        return list(OVERALL_PARTS[position])
+    return ["split"]
+
+def view_options(detail):
+    """세부사항별 월/이닝 선택지 (없으면 [None])"""
+    if detail == "월별":
+        return MONTH_OPTIONS
+    if detail == "이닝별":
+        return INNING_OPTIONS
+    return [None]
+
+# 섹션이 읽는 파일 — 격리 안내를 어느 섹션에 붙일지 결정 (같은 파일을 읽는 섹션이 여럿이면 한 곳에만)
+OVERALL_PART_FILES = {
+    "타자": {
+        "metrics": ["타자_최종성적1.xlsx", "타자_최종성적2.xlsx"],
+        "trend":   [f for f, _ in BATTER_MONTH_DEFS],
+    },
+    "투수": {
+        "metrics": PITCHER_TOTAL_FILES,
+        "trend":   [f for f, _ in PITCHER_MONTH_DEFS],
+    },
+}
+
+def split_file(position, detail, sub_selection):
+    """분할 세부사항 뷰가 읽는 파일명"""
+    if detail == "이닝별":
+        return (PITCHER_INNING_FILES if position == "투수" else BATTER_INNING_FILES).get(sub_selection)
+    if detail == "월별":
+        return (PITCHER_MONTH_FILES if position == "투수" else BATTER_MONTH_FILES).get(sub_selection)
+    return {
+        "주자 있음": f"{position}_주자있음.xlsx",
+        "주자 없음": f"{position}_주자없음.xlsx",
+        "주자 득점권": f"{position}_주자득점권.xlsx",
+    }.get(detail)
+
+def quarantine_section(held, fnames):
+    """fnames 중 이 선수 행이 격리된 파일이 있으면 안내 섹션, 없으면 None"""
+    hit = [os.path.basename(p) for p in (find_path(held, f) for f in fnames) if p]
+    if not hit:
+        return None
+    return {"kind": "warning",
+            "text": f"분할 정합성 불일치로 격리된 데이터입니다 — {', '.join(hit)} (불일치 리포트 참고)"}
+
+def compute_part(position, paths, player_name, detail, sub_selection, part, held=()):
+    """
+    (포지션, 선수, 세부사항, 월/이닝 선택, 섹션) 하나의 뷰 모델(섹션 리스트)을 계산.
+    - paths: 이 선수에게 서빙하는 경로, held: 이 선수 행이 격리돼 paths에서 빠진 경로
+    - 격리된 파일 때문에 비는 부분은 '파일 없음/선수 없음' 대신 격리 안내(warning)로 표시
+    """
+    if detail == "세부사항 없음":
+        sections = OVERALL_PARTS[position][part](paths, player_name)
+        notice = quarantine_section(held, OVERALL_PART_FILES[position].get(part, []))
+        if notice is None:
+            return sections
+        return [notice] + [s for s in sections if s["kind"] not in ("error", "info")]
+    notice = quarantine_section(held, [split_file(position, detail, sub_selection)])
+    if notice is not None:
+        return [notice]
+    if position == "타자":
+        if detail == "주자 있음":
+            return batter_onbase_sections(paths, player_name, has_runner=True)
+        if detail == "주자 없음":
+            return batter_onbase_sections(paths, player_name, has_runner=False)
+        if detail == "주자 득점권":
+            return batter_risp_sections(paths, player_name)
+        if detail == "이닝별":
+            return batter_inning_sections(paths, player_name, sub_selection)
+        if detail == "월별":
+            return batter_month_sections(paths, player_name, sub_selection)
+    else:
+        if detail == "주자 있음":
+            return pitcher_onbase_sections(paths, player_name, has_runner=True)
+        if detail == "주자 없음":
+            return pitcher_onbase_sections(paths, player_name, has_runner=False)
+        if detail == "주자 득점권":
+            return pitcher_risp_sections(paths, player_name)
+        if detail == "이닝별":
+            return pitcher_inning_sections(paths, player_name, sub_selection)
+        if detail == "월별":
+            return pitcher_month_sections(paths, player_name, sub_selection)
+    return []
+
+def compute_view(position, paths, player_name, detail, sub_selection=None, held=()):
+    """뷰 전체(모든 섹션)를 순서대로 계산"""
+    sections = []
+    for part in view_parts(position, detail):
+        sections += compute_part(position, paths, player_name, detail, sub_selection, part, held)
+    return sections